@@ -0,0 +1,192 @@
+"""
+Synthetic, deterministic inputs for the benchmarks: Job objects and HTML
+shaped like LinkedIn's seeMoreJobPostings fragments and Python.org's
+/jobs/ page. Same seed, same bytes, so runs are comparable.
+"""
+import html
+import random
+from datetime import datetime, timedelta
+from typing import List
+from src.models import Job
+
+BASE_TIME = datetime(2026, 1, 1, 8, 0, 0)
+
+LEVELS = ["", "", "", "Senior", "Junior", "Lead", "Principal", "Sr.", "Staff", "Associate"]
+STACKS = ["Python", "Django", "React", "Java", "Golang", "Node.js", "Data", "Cloud", "DevOps", "QA Automation",
+          "Machine Learning", "Full Stack", "Frontend", "Backend", "Android", "iOS", "Salesforce", "SAP", "R&D"]
+ROLES = ["Engineer", "Developer", "Software Engineer", "Architect", "Analyst", "Scientist", "Tester", "Consultant", "Intern"]
+SUFFIXES = ["", "", "", " II", " III", " (Remote)", " - Bengaluru", " | 3+ years", " - Fresher", " – Contract"]
+COMPANY_WORDS = ["Tata", "Infosys", "Acme", "Zoho", "Freshworks", "Globex", "Initech", "Umbrella", "Hooli", "Stark",
+                 "Wayne", "Cyberdyne", "Soylent", "Wonka", "Razorpay", "Swiggy", "Nykaa", "Vedantu", "Sarvam", "Krutrim"]
+COMPANY_KINDS = ["Technologies", "Labs", "Systems", "Consultancy Services", "Software", "Digital", "Solutions", "AI", ""]
+COMPANY_FORMS = ["", "", " Pvt. Ltd.", " Private Limited", " Inc.", " LLP", " GmbH"]
+LOCATIONS = [
+    "Bengaluru, Karnataka, India", "Bangalore Urban, Karnataka, India", "Hyderabad, Telangana, India",
+    "Pune, Maharashtra, India", "Mumbai, Maharashtra, India", "Chennai, Tamil Nadu, India", "Gurgaon, Haryana, India",
+    "Noida, Uttar Pradesh, India", "New Delhi, Delhi, India", "India", "Remote", "Remote, India",
+    "London, England, United Kingdom", "New York, NY, United States", "Berlin, Germany", "Singapore",
+    "Shanghai, China", "Toronto, Ontario, Canada", "Amsterdam, North Holland, Netherlands", "",
+]
+SOURCES = ["LinkedIn", "LinkedIn", "LinkedIn", "Python.org"]
+
+def _title(rng: random.Random) -> str:
+    level = rng.choice(LEVELS)
+    return f"{level + ' ' if level else ''}{rng.choice(STACKS)} {rng.choice(ROLES)}{rng.choice(SUFFIXES)}"
+
+def _company(rng: random.Random) -> str:
+    kind = rng.choice(COMPANY_KINDS)
+    return f"{rng.choice(COMPANY_WORDS)}{' ' + kind if kind else ''}{rng.choice(COMPANY_FORMS)}"
+
+def generate_jobs(count: int, seed: int = 0) -> List[Job]:
+    """
+    count distinct jobs, oldest first, one every 30 seconds. Titles,
+    companies and locations repeat like real listings do (a few thousand
+    distinct titles, a few hundred companies, ~20 locations).
+    """
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        location = rng.choice(LOCATIONS)
+        job = Job(
+            title=_title(rng),
+            company=_company(rng),
+            location=location or "Remote",
+            apply_url=f"https://in.linkedin.com/jobs/view/{3_800_000_000 + i}",
+            source_name=rng.choice(SOURCES),
+            fetched_at=BASE_TIME + timedelta(seconds=30 * i),
+        )
+        job.generate_hash()
+        jobs.append(job)
+    return jobs
+
+def _linkedin_card(rng: random.Random, job_id: int, position: int) -> str:
+    title = html.escape(_title(rng))
+    company = html.escape(_company(rng))
+    location = rng.choice(LOCATIONS)
+    slug = "-".join(title.lower().replace("&amp;", "and").split())
+    location_html = f"""
+          <span class="job-search-card__location">
+            {html.escape(location)}
+          </span>""" if location else ""
+    benefits = """
+          <div class="job-posting-benefits text-sm">
+            <icon class="job-posting-benefits__icon" data-delayed-url="https://static.licdn.com/aero-v1/sc/h/cyolgscd0imw2ldqppkrb84vo" data-svg-class-name="job-posting-benefits__icon-svg"></icon>
+            <span class="job-posting-benefits__text">
+              Actively Hiring
+            </span>
+          </div>""" if rng.random() < 0.3 else ""
+    if rng.random() < 0.02:
+        # Promoted / malformed card without a title, the parser skips it
+        return f"""
+<li>
+  <div class="base-card relative w-full base-search-card job-search-card" data-entity-urn="urn:li:jobPosting:{job_id}">
+    <div class="base-search-card__info"><h4 class="base-search-card__subtitle">{company}</h4></div>
+  </div>
+</li>"""
+    return f"""
+<li>
+  <div class="base-card relative w-full hover:no-underline focus:no-underline base-card--link base-search-card base-search-card--link job-search-card" data-entity-urn="urn:li:jobPosting:{job_id}" data-impression-id="jobs-search-result-{position}" data-reference-id="Xy1b2c3d4e5f6g7h8i9j0k==" data-tracking-id="AbCdEfGhIjKlMnOpQrStUv==" data-column="1" data-row="{position + 1}">
+    <a class="base-card__full-link absolute top-0 right-0 bottom-0 left-0 p-0 z-[2]" href="https://in.linkedin.com/jobs/view/{slug}-at-{job_id}?position={position + 1}&amp;pageNum=0&amp;refId=Xy1b2c3d4e5f6g7h8i9j0k%3D%3D&amp;trackingId=AbCdEfGhIjKlMnOpQrStUv%3D%3D" data-tracking-control-name="public_jobs_jserp-result_search-card" data-tracking-client-ingraph data-tracking-will-navigate>
+      <span class="sr-only">
+          {title}
+      </span>
+    </a>
+    <div class="search-entity-media">
+        <img class="artdeco-entity-image artdeco-entity-image--square-4" data-delayed-url="https://media.licdn.com/dms/image/v2/C4D0BAQ{job_id}/company-logo_100_100/0/1630000000000?e=2147483647&amp;v=beta" data-ghost-classes="artdeco-entity-image--ghost" data-ghost-url="https://static.licdn.com/aero-v1/sc/h/9a9u41thxt325ucfh5z8ga4m8" alt="{company}">
+    </div>
+    <div class="base-search-card__info">
+      <h3 class="base-search-card__title">
+            {title}
+      </h3>
+      <h4 class="base-search-card__subtitle">
+          <a class="hidden-nested-link" data-tracking-client-ingraph data-tracking-control-name="public_jobs_jserp-result_job-search-card-subtitle" data-tracking-will-navigate href="https://in.linkedin.com/company/{slug[:20]}?trk=public_jobs_jserp-result_job-search-card-subtitle">
+            {company}
+          </a>
+      </h4>
+      <div class="base-search-card__metadata">{location_html}{benefits}
+          <time class="job-search-card__listdate" datetime="2026-01-{1 + job_id % 28:02d}">
+            {1 + job_id % 6} days ago
+          </time>
+      </div>
+    </div>
+  </div>
+</li>"""
+
+def linkedin_pages(count: int, page_size: int = 25, seed: int = 0) -> List[str]:
+    """seeMoreJobPostings responses (bare <li> fragments) holding count cards in total."""
+    rng = random.Random(seed)
+    pages = []
+    for start in range(0, count, page_size):
+        cards = [_linkedin_card(rng, 3_800_000_000 + start + i, i) for i in range(min(page_size, count - start))]
+        pages.append("".join(cards))
+    return pages
+
+# Stand-in for the python.org header, navigation and footer around the listing
+_PYTHON_ORG_NAV = "".join(
+    f'<li class="tier-1 element-{i}"><a href="/section-{i}/" title="Section {i}">Section {i}</a>'
+    f'<ul class="subnav menu">{"".join(f"<li class=tier-2><a href=/section-{i}/{j}/>Item {j}</a></li>" for j in range(8))}</ul></li>'
+    for i in range(12)
+)
+PYTHON_ORG_HEAD = f"""<!doctype html>
+<html class="no-js" lang="en" dir="ltr">
+<head>
+    <meta charset="utf-8">
+    <title>Python Job Board | Python.org</title>
+    <link rel="stylesheet" href="/static/stylesheets/style.css" title="default" />
+    <script type="text/javascript" src="/static/js/libs/modernizr.js"></script>
+</head>
+<body class="python jobs">
+    <div id="touchnav-wrapper">
+        <header class="main-header" role="banner">
+            <nav id="mainnav" class="python-navigation main-navigation do-not-print" role="navigation">
+                <ul class="navigation menu" role="menubar">{_PYTHON_ORG_NAV}</ul>
+            </nav>
+        </header>
+        <div id="content" class="content-wrapper">
+            <section class="main-content with-left-sidebar" role="main">
+                <header class="article-header"><h1 class="page-title">Python Job Board</h1></header>
+                <div class="job-list">
+                <ol class="list-recent-jobs list-row-container menu">"""
+PYTHON_ORG_FOOT = f"""
+                </ol>
+                <ul class="pagination menu">
+                    <li class="previous"><a href="?page=1" class="disabled">Previous</a></li>
+                    <li class="next"><a href="?page=2">Next</a></li>
+                </ul>
+                </div>
+            </section>
+            <aside class="left-sidebar" role="secondary"><ul class="menu">{_PYTHON_ORG_NAV}</ul></aside>
+        </div>
+        <footer id="site-map" class="main-footer" role="contentinfo"><ul class="sitemap navigation menu">{_PYTHON_ORG_NAV}</ul></footer>
+    </div>
+</body>
+</html>"""
+
+def _python_org_item(rng: random.Random, job_id: int) -> str:
+    title = html.escape(_title(rng))
+    company = html.escape(_company(rng))
+    location = html.escape(rng.choice(LOCATIONS) or "Remote, Remote, Remote")
+    # Fresh postings carry a "New" badge inside the name span (the parser keeps it in the company)
+    badge = '<span class="listing-new">New</span>\n                        ' if rng.random() < 0.1 else ""
+    types = ", ".join(f'<a href="/jobs/type/{kind.lower()}/">{kind}</a>' for kind in rng.sample(["Back end", "Django", "Cloud", "Testing", "Web"], 2))
+    return f"""
+                    <li>
+                        <h2 class="listing-company">
+                            <span class="listing-company-name">
+                        {badge}<a href="/jobs/{job_id}/">{title}</a><br/>
+                        {company}
+                            </span>
+                            <span class="listing-location"><a href="/jobs/location/{job_id % 50}/">{location}</a></span>
+                        </h2>
+                        <span class="listing-job-type">{types}</span>
+                        <span class="listing-posted">Posted: <time datetime="2026-01-{1 + job_id % 28:02d}T10:20:00+00:00">{1 + job_id % 28} January 2026</time></span>
+                    </li>"""
+
+def python_org_pages(count: int, page_size: int = 25, seed: int = 0) -> List[str]:
+    """Full python.org /jobs/ pages (header, nav, footer) holding count listings in total."""
+    rng = random.Random(seed)
+    pages = []
+    for start in range(0, count, page_size):
+        items = "".join(_python_org_item(rng, 7000 + start + i) for i in range(min(page_size, count - start)))
+        pages.append(PYTHON_ORG_HEAD + items + PYTHON_ORG_FOOT)
+    return pages
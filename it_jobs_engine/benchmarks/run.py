@@ -0,0 +1,290 @@
+"""
+Offline benchmarks for the hot paths: parsing, categorizing, filtering,
+storing and building the site. Run from it_jobs_engine/:
+
+    python -m benchmarks.run                              # everything at 1k, 10k and 100k jobs
+    python -m benchmarks.run --sizes 1000 --only parse_linkedin categorize
+    python -m benchmarks.run --baseline benchmarks/results/baseline.json
+    python -m benchmarks.run --check-parity
+
+Results are written as JSON (--output). With --baseline, every benchmark is
+compared against the saved run and the exit status is 1 if any got slower
+than --threshold allows. --check-parity parses the fixture pages in fast
+and full mode and compares every job, field by field, with the output
+recorded in benchmarks/expected/ (exit status 1 on any difference).
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from functools import lru_cache
+
+from benchmarks.fixtures import generate_jobs, linkedin_pages, python_org_pages
+from src.db import DatabaseManager
+from src.fetchers.linkedin import LinkedInFetcher
+from src.fetchers.python_org import PythonOrgFetcher
+from src.processors.categorizer import JobCategorizer
+from src.processors.filters import LocationFilter
+from src.processors.static_generator import StaticSiteGenerator
+from src.utils.soup import FAST_PARSER
+from config.settings import HTML_FAST_PARSE
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(__file__), "results", "latest.json")
+INSERT_BATCH = 1000  # Jobs saved per save_jobs call, about one fetch cycle
+EXPECTED_DIR = os.path.join(os.path.dirname(__file__), "expected")
+PARITY_SIZE = 200  # Fixture jobs per source checked by --check-parity
+# Every Job field a fetcher sets (fetched_at is the parse time)
+PARSED_FIELDS = ("title", "company", "location", "apply_url", "source_name", "experience_level", "role_category", "job_hash")
+
+class Timer:
+    """Times only the with-block, so fixture setup doesn't count."""
+
+    def __enter__(self):
+        gc.collect()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.seconds = time.perf_counter() - self.start
+
+# Fixtures are built once per size and shared by every run
+@lru_cache(maxsize=None)
+def _jobs(size: int):
+    jobs = generate_jobs(size)
+    for job, (role, experience) in zip(jobs, JobCategorizer.categorize_many(job.title for job in jobs)):
+        job.role_category = role
+        job.experience_level = experience
+    return jobs
+
+@lru_cache(maxsize=None)
+def _database(size: int) -> str:
+    path = os.path.join(_workdir(), f"site_{size}.db")
+    db = DatabaseManager(path)
+    for start in range(0, size, INSERT_BATCH):
+        db.save_jobs(_jobs(size)[start:start + INSERT_BATCH])
+    return path
+
+@lru_cache(maxsize=None)
+def _workdir() -> str:
+    return tempfile.mkdtemp(prefix="jobs_engine_bench_")
+
+def bench_parse_linkedin(size, timer):
+    pages = linkedin_pages(size)
+    fetcher = LinkedInFetcher()
+    JobCategorizer._categorize_text.cache_clear()
+    with timer:
+        for page in pages:
+            fetcher._parse_cards(page)
+
+def bench_parse_python_org(size, timer):
+    pages = python_org_pages(size)
+    fetcher = PythonOrgFetcher()
+    JobCategorizer._categorize_text.cache_clear()
+    with timer:
+        for page in pages:
+            fetcher._parse_listing(page)
+
+def bench_categorize(size, timer):
+    titles = [job.title for job in _jobs(size)]
+    JobCategorizer._categorize_text.cache_clear()  # Cold cache: the first cycle after a restart
+    with timer:
+        for title in titles:
+            JobCategorizer.categorize(title)
+
+def bench_location_filter(size, timer):
+    locations = [job.location for job in _jobs(size)]
+    location_filter = LocationFilter()
+    with timer:
+        for location in locations:
+            location_filter.is_allowed(location)
+
+def bench_db_insert(size, timer):
+    jobs = _jobs(size)
+    db = DatabaseManager(os.path.join(tempfile.mkdtemp(dir=_workdir()), "jobs.db"))
+    with timer:
+        for start in range(0, size, INSERT_BATCH):
+            db.save_jobs(jobs[start:start + INSERT_BATCH])
+    db.close()
+
+def bench_site_build(size, timer):
+    db = DatabaseManager(_database(size))
+    output_dir = os.path.join(tempfile.mkdtemp(dir=_workdir()), "docs")
+    with timer:
+        StaticSiteGenerator(output_dir, db).build(incremental=False)
+    shutil.rmtree(os.path.dirname(output_dir))
+
+def bench_site_rebuild(size, timer):
+    # Incremental build with nothing changed, the common case between fetch cycles
+    db = DatabaseManager(_database(size))
+    output_dir = os.path.join(tempfile.mkdtemp(dir=_workdir()), "docs")
+    StaticSiteGenerator(output_dir, db).build(incremental=False)
+    with timer:
+        StaticSiteGenerator(output_dir, db).build(incremental=True)
+    shutil.rmtree(os.path.dirname(output_dir))
+
+BENCHMARKS = {
+    "parse_linkedin": bench_parse_linkedin,
+    "parse_python_org": bench_parse_python_org,
+    "categorize": bench_categorize,
+    "location_filter": bench_location_filter,
+    "db_insert": bench_db_insert,
+    "site_build": bench_site_build,
+    "site_rebuild": bench_site_rebuild,
+}
+
+def run(names, sizes, repeat: int) -> dict:
+    results = {}
+    for size in sizes:
+        for name in names:
+            runs = []
+            # The 100k runs take minutes each, one is enough to spot a regression
+            for _ in range(repeat if size < 100000 else 1):
+                timer = Timer()
+                BENCHMARKS[name](size, timer)
+                runs.append(timer.seconds)
+            best = min(runs)
+            results[f"{name}@{size}"] = {
+                "benchmark": name,
+                "size": size,
+                "seconds": round(best, 6),
+                "per_item_us": round(best / size * 1e6, 3),
+                "runs": [round(seconds, 6) for seconds in runs],
+            }
+            print(f"{name:<18} {size:>7}  {best:9.3f}s  {best / size * 1e6:10.2f} us/job", flush=True)
+    return results
+
+# Parity: fast parsing must return exactly the jobs the original parser returned
+PARITY_SOURCES = {
+    "linkedin": (LinkedInFetcher, "_parse_cards", linkedin_pages),
+    "python_org": (PythonOrgFetcher, "_parse_listing", python_org_pages),
+}
+
+def _parse_fixtures(source: str, fast: bool) -> list:
+    fetcher_class, method, pages = PARITY_SOURCES[source]
+    fetcher = fetcher_class()
+    fetcher.fast_parse = fast
+    parse = getattr(fetcher, method)
+    return [
+        {field: getattr(job, field) for field in PARSED_FIELDS}
+        for page in pages(PARITY_SIZE) for job in parse(page)
+    ]
+
+def _expected_path(source: str) -> str:
+    return os.path.join(EXPECTED_DIR, f"{source}.json")
+
+def record_parity():
+    """Re-records the expected jobs (full parse). Only needed after changing the fixtures."""
+    os.makedirs(EXPECTED_DIR, exist_ok=True)
+    for source in PARITY_SOURCES:
+        with open(_expected_path(source), "w", encoding="utf-8") as f:
+            json.dump(_parse_fixtures(source, fast=False), f, indent=0, ensure_ascii=False)
+        print(f"Recorded {_expected_path(source)}")
+
+def check_parity() -> bool:
+    ok = True
+    for source in PARITY_SOURCES:
+        with open(_expected_path(source), "r", encoding="utf-8") as f:
+            expected = json.load(f)
+        for fast in (True, False):
+            mode = "fast" if fast else "full"
+            jobs = _parse_fixtures(source, fast)
+            mismatches = [
+                (i, field, want.get(field), got.get(field))
+                for i, (want, got) in enumerate(zip(expected, jobs))
+                for field in PARSED_FIELDS if want.get(field) != got.get(field)
+            ]
+            if len(jobs) != len(expected):
+                mismatches.append((None, "count", len(expected), len(jobs)))
+            print(f"{source:<12} {mode}: {len(jobs)} jobs, {len(mismatches)} differences")
+            for i, field, want, got in mismatches[:10]:
+                print(f"    job {i} {field}: expected {want!r}, got {got!r}")
+            ok = ok and not mismatches
+    return ok
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """Prints current vs. baseline for every benchmark in both; returns the keys that regressed."""
+    regressions = []
+    print(f"\n{'benchmark':<26} {'baseline':>10} {'current':>10} {'change':>8}")
+    for key, result in results.items():
+        previous = baseline.get("results", {}).get(key)
+        if not previous:
+            continue
+        ratio = result["seconds"] / previous["seconds"] if previous["seconds"] else 1.0
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions.append(key)
+        elif ratio < 1 - threshold:
+            flag = "  faster"
+        print(f"{key:<26} {previous['seconds']:>9.3f}s {result['seconds']:>9.3f}s {ratio - 1:>+8.1%}{flag}")
+    return regressions
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the jobs engine.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Job counts to run at")
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="Run only these benchmarks")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per benchmark, the fastest counts (1 at 100k+)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Where to write the JSON results")
+    parser.add_argument("--baseline", help="Earlier results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Slowdown that counts as a regression (0.15 = 15%%)")
+    parser.add_argument("--check-parity", action="store_true", help="Only check fast parsing against the recorded jobs")
+    parser.add_argument("--record-parity", action="store_true", help="Re-record the expected jobs for --check-parity")
+    args = parser.parse_args(argv)
+
+    # The pipeline's INFO logging would drown the table (and time the log file too)
+    logging.getLogger("it_jobs_engine").setLevel(logging.WARNING)
+    if args.record_parity:
+        record_parity()
+        return 0
+    if args.check_parity:
+        return 0 if check_parity() else 1
+
+    try:
+        results = run(args.only or list(BENCHMARKS), sorted(args.sizes), args.repeat)
+    finally:
+        shutil.rmtree(_workdir(), ignore_errors=True)
+
+    report = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "git": _git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "html_parser": FAST_PARSER if HTML_FAST_PARSE else "html.parser",
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) slower than the baseline by more than {args.threshold:.0%}")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,10 +15,36 @@ LOG_DIR.mkdir(parents=True, exist_ok=True)
 DB_PATH = DATA_DIR / "jobs.db"
 LOG_FILE = LOG_DIR / "app.log"
 
+# SQLite Tuning (applied to every connection, see src/db.py)
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))  # Wait this long for a lock instead of failing
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", str(64 * 1024)))  # Page cache per connection
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))  # Bytes of the DB file read via mmap
+DB_BATCH_SIZE = int(os.getenv("DB_BATCH_SIZE", "500"))  # Rows per query when streaming jobs out of the DB
+
 # Fetcher Settings
 USER_AGENT = os.getenv("USER_AGENT", "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
 REQUEST_TIMEOUT = 10
+# Fast parsing: only the job list / cards of a page become a tree (SoupStrainer), with lxml if it's installed (pip install lxml).
+# Same jobs either way (python -m benchmarks.run --check-parity); false parses whole pages with html.parser.
+HTML_FAST_PARSE = os.getenv("HTML_FAST_PARSE", "true").lower() == "true"
+
+# HTTP Transport Settings (shared keep-alive sessions, one per host)
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "10"))  # Keep >= LINKEDIN_MAX_CONCURRENCY
+HTTP_MAX_RETRIES = int(os.getenv("HTTP_MAX_RETRIES", "3"))
+HTTP_BACKOFF_FACTOR = float(os.getenv("HTTP_BACKOFF_FACTOR", "0.5"))  # 0.5s, 1s, 2s, ... plus jitter
+HTTP_BACKOFF_MAX = float(os.getenv("HTTP_BACKOFF_MAX", "30"))  # Also caps how long we honor Retry-After
+
+# HTTP Response Cache (conditional GET with ETag / Last-Modified)
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true"
+HTTP_CACHE_DIR = DATA_DIR / "http_cache"
+HTTP_CACHE_MAX_BYTES = int(os.getenv("HTTP_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))  # Least recently used evicted first
+HTTP_CACHE_TTL_SECONDS = int(os.getenv("HTTP_CACHE_TTL_SECONDS", str(24 * 3600)))  # Older entries are refetched in full
 FETCH_INTERVAL_MINUTES = int(os.getenv("FETCH_INTERVAL_MINUTES", "15"))
+# Each source gets its own deadline; whatever it hasn't returned by then is dropped for this cycle
+FETCH_SOURCE_DEADLINE_SECONDS = int(os.getenv("FETCH_SOURCE_DEADLINE_SECONDS", "60"))
+# Max fetchers running at once (None = one thread per enabled source)
+FETCH_MAX_WORKERS = int(os.getenv("FETCH_MAX_WORKERS", "0")) or None
 
 # Telegram Settings
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
@@ -29,7 +55,66 @@ BLOG_API_URL = os.getenv("BLOG_API_URL")
 BLOG_USERNAME = os.getenv("BLOG_USERNAME")
 BLOG_PASSWORD = os.getenv("BLOG_PASSWORD")
 
+# Publishing Limits (per channel: sustained rate, burst size, parallel requests)
+# Telegram allows ~20 messages per minute into one channel; sending faster gets 429 flood waits.
+TELEGRAM_RATE_PER_MINUTE = float(os.getenv("TELEGRAM_RATE_PER_MINUTE", "20"))
+TELEGRAM_BURST = int(os.getenv("TELEGRAM_BURST", "1"))
+TELEGRAM_CONCURRENCY = int(os.getenv("TELEGRAM_CONCURRENCY", "1"))  # Also keeps messages in order
+# Digest mode: many jobs per message (grouped by category, one link each) instead of one message per job.
+# A digest goes out once TELEGRAM_DIGEST_MIN_JOBS are waiting, or when the oldest has waited TELEGRAM_DIGEST_MAX_WAIT_MINUTES.
+TELEGRAM_DIGEST_ENABLED = os.getenv("TELEGRAM_DIGEST_ENABLED", "false").lower() == "true"
+TELEGRAM_DIGEST_MIN_JOBS = int(os.getenv("TELEGRAM_DIGEST_MIN_JOBS", "15"))
+TELEGRAM_DIGEST_MAX_WAIT_MINUTES = float(os.getenv("TELEGRAM_DIGEST_MAX_WAIT_MINUTES", "60"))
+TELEGRAM_DIGEST_BATCH = int(os.getenv("TELEGRAM_DIGEST_BATCH", "200"))  # Jobs packed per flush (split over as many messages as needed)
+BLOG_RATE_PER_MINUTE = float(os.getenv("BLOG_RATE_PER_MINUTE", "60"))
+BLOG_BURST = int(os.getenv("BLOG_BURST", "5"))
+BLOG_CONCURRENCY = int(os.getenv("BLOG_CONCURRENCY", "4"))
+LINKEDIN_PUBLISH_RATE_PER_MINUTE = float(os.getenv("LINKEDIN_PUBLISH_RATE_PER_MINUTE", "10"))
+LINKEDIN_PUBLISH_BURST = int(os.getenv("LINKEDIN_PUBLISH_BURST", "1"))
+LINKEDIN_PUBLISH_CONCURRENCY = int(os.getenv("LINKEDIN_PUBLISH_CONCURRENCY", "1"))
+# A 429 pauses the channel for the server's retry_after; the post is retried this many times before it counts as failed
+PUBLISH_RATE_LIMIT_RETRIES = int(os.getenv("PUBLISH_RATE_LIMIT_RETRIES", "3"))
+# Publish Outbox (src/db.py publish_outbox): failed posts are retried with exponential backoff plus jitter
+PUBLISH_MAX_ATTEMPTS = int(os.getenv("PUBLISH_MAX_ATTEMPTS", "6"))  # Then the channel gives up on the job (FAILED)
+PUBLISH_BACKOFF_BASE_SECONDS = float(os.getenv("PUBLISH_BACKOFF_BASE_SECONDS", "60"))  # 1m, 2m, 4m, ...
+PUBLISH_BACKOFF_MAX_SECONDS = float(os.getenv("PUBLISH_BACKOFF_MAX_SECONDS", str(6 * 3600)))
+PUBLISH_CLAIM_BATCH = int(os.getenv("PUBLISH_CLAIM_BATCH", "20"))  # Outbox rows a worker claims at a time
+PUBLISH_LEASE_SECONDS = float(os.getenv("PUBLISH_LEASE_SECONDS", "900"))  # Claimed rows of a crashed run are retried after this
+
+# Static Site Settings
+# Incremental builds only re-render pages whose inputs changed (tracked in docs/.build-manifest.json).
+# Set to false to wipe docs/ and rebuild everything.
+STATIC_INCREMENTAL_BUILD = os.getenv("STATIC_INCREMENTAL_BUILD", "true").lower() == "true"
+# Job pages are rendered in chunks on a process pool (one worker per core by default)
+STATIC_RENDER_WORKERS = int(os.getenv("STATIC_RENDER_WORKERS", "0")) or os.cpu_count() or 1
+STATIC_RENDER_CHUNK_SIZE = int(os.getenv("STATIC_RENDER_CHUNK_SIZE", "500"))
+JINJA_CACHE_DIR = DATA_DIR / "jinja_cache"  # Compiled template bytecode
+STATIC_PAGE_SIZE = int(os.getenv("STATIC_PAGE_SIZE", "50"))  # Jobs per listing page (home page and archives)
+STATIC_NAV_TOP_LOCATIONS = 12  # Locations linked from the home page filters
+# Public URL of the published site, used for absolute links in sitemap.xml
+SITE_URL = os.getenv("SITE_URL", "https://prajwalbr625.github.io/Jobs_Engine")
+
+# Local Blog Preview (local_blog.py)
+LOCAL_BLOG_PAGE_SIZE = int(os.getenv("LOCAL_BLOG_PAGE_SIZE", "30"))  # Jobs per page
+LOCAL_BLOG_POOL_SIZE = int(os.getenv("LOCAL_BLOG_POOL_SIZE", "8"))  # Read-only DB connections shared by request threads
+LOCAL_BLOG_POST_CACHE_SIZE = int(os.getenv("LOCAL_BLOG_POST_CACHE_SIZE", "512"))  # Rendered job pages kept in memory
+# Cache-Control max-age; after it expires clients and proxies revalidate with ETag / Last-Modified and get a 304
+LOCAL_BLOG_LIST_MAX_AGE = int(os.getenv("LOCAL_BLOG_LIST_MAX_AGE", "60"))
+LOCAL_BLOG_POST_MAX_AGE = int(os.getenv("LOCAL_BLOG_POST_MAX_AGE", str(24 * 3600)))  # Job pages never change once written
+
+# JSON API (local_blog.py /api/jobs and the static docs/api/ export)
+API_DEFAULT_LIMIT = int(os.getenv("API_DEFAULT_LIMIT", "100"))  # Jobs per response unless limit= asks otherwise
+API_MAX_LIMIT = int(os.getenv("API_MAX_LIMIT", "1000"))
+API_PAGE_SIZE = int(os.getenv("API_PAGE_SIZE", "1000"))  # Job ids per docs/api/jobs/<n>.json file
+
 # LinkedIn Settings
+# Every keyword is searched in every location (keyword x location query matrix)
+LINKEDIN_KEYWORDS = ["Software Engineer", "Python Developer", "Backend Developer", "Frontend Developer", "DevOps Engineer", "Data Engineer"]
+LINKEDIN_LOCATIONS = ["India", "Bengaluru", "Hyderabad", "Pune"]
+LINKEDIN_PAGE_SIZE = 25  # Cards returned per seeMoreJobPostings page (the start= step)
+LINKEDIN_MAX_PAGES = int(os.getenv("LINKEDIN_MAX_PAGES", "40"))  # Per query
+LINKEDIN_MAX_CONCURRENCY = int(os.getenv("LINKEDIN_MAX_CONCURRENCY", "4"))  # Queries walked in parallel
+
 # Location Filtering
 # Only allow jobs that match at least one of these keywords (Case-insensitive)
 # Set to None or empty list to allow ALL locations.
@@ -1,15 +1,32 @@
-from flask import Flask, render_template_string, abort, request
-import sqlite3
+import hashlib
+from datetime import datetime
+from functools import lru_cache
+from urllib.parse import urlencode
+from flask import Flask, Response, abort, request
+from werkzeug.http import is_resource_modified
 from src.processors.formatter import ContentFormatter
+from src.processors.categorizer import JobCategorizer
 from src.models import Job
-from config.settings import DB_PATH
+from src.processors.api_export import parse_fields, job_to_dict, dump
+from src.db import ConnectionPool, migrate, in_sqlite_range, job_row_factory, search_jobs, sync_jobs, first_id_after, JOB_SELECT
+from src.utils.logger import logger
+from config.settings import (
+    DB_PATH, LOCAL_BLOG_PAGE_SIZE, LOCAL_BLOG_POOL_SIZE, LOCAL_BLOG_POST_CACHE_SIZE,
+    LOCAL_BLOG_LIST_MAX_AGE, LOCAL_BLOG_POST_MAX_AGE, API_DEFAULT_LIMIT, API_MAX_LIMIT
+)
 
 app = Flask(__name__)
 
-def get_db_connection():
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    return conn
+# The pool below only reads, so bring the schema up to date once here: the preview may be
+# started before the scheduler has ever opened this DB.
+try:
+    migrate(DB_PATH)
+except Exception as e:
+    logger.error(f"Failed to migrate {DB_PATH}: {e}")
+
+# Read-only, WAL-aware connections so previews never block the scheduler's writes.
+# Opened on first use and reused by later requests.
+db_pool = ConnectionPool(DB_PATH, LOCAL_BLOG_POOL_SIZE, row_factory=job_row_factory)
 
 # Simple HTML Templates with "Media-First" aesthetic (Clean, readable)
 
@@ -101,7 +118,7 @@ LAYOUT = """
             box-shadow: 0 1px 3px rgba(0,0,0,0.1);
         }
         .filters form { display: flex; gap: 10px; flex-wrap: wrap; }
-        .filters input {
+        .filters input, .filters select {
             flex-grow: 1;
             padding: 10px;
             border: 1px solid #d1d5db;
@@ -126,6 +143,8 @@ LAYOUT = """
         .post-content h2, .post-content h3 { color: #111827; margin-top: 1.5em; }
         .post-content p { margin-bottom: 1em; }
         .post-content a { color: var(--primary); text-decoration: underline; }
+        .pagination { display: flex; justify-content: space-between; margin: 30px 0; }
+        .pagination a { color: var(--primary); font-weight: 600; text-decoration: none; }
     </style>
 </head>
 <body>
@@ -144,9 +163,22 @@ INDEX_CONTENT = """
     
     <div class="filters">
         <form action="/" method="get">
-            <input type="text" name="location" placeholder="Filter by Location (e.g. Bangalore, Remote)" value="{{ location_filter }}">
+            <input type="text" name="q" placeholder="Search title, company, skill..." value="{{ q }}">
+            <input type="text" name="location" placeholder="Filter by Location (e.g. Bangalore, Remote)" value="{{ filters.location }}">
+            <select name="role_category">
+                <option value="">All categories</option>
+                {% for category in categories %}
+                <option value="{{ category }}" {% if category == filters.role_category %}selected{% endif %}>{{ category }}</option>
+                {% endfor %}
+            </select>
+            <select name="experience_level">
+                <option value="">Any experience</option>
+                {% for level in experience_levels %}
+                <option value="{{ level }}" {% if level == filters.experience_level %}selected{% endif %}>{{ level }}</option>
+                {% endfor %}
+            </select>
             <button type="submit">Filter</button>
-            {% if location_filter %}
+            {% if q or filters.values() | select | list %}
                 <a href="/" class="btn">Clear</a>
             {% endif %}
         </form>
@@ -177,6 +209,11 @@ INDEX_CONTENT = """
         <a href="/post/{{ post.job_hash }}" class="read-more">Read Details &rarr;</a>
     </div>
     {% endfor %}
+    
+    <div class="pagination">
+        {% if cursor %}<a href="/?{{ first_page }}">&larr; Newest</a>{% else %}<span></span>{% endif %}
+        {% if next_page %}<a href="/?{{ next_page }}">Older jobs &rarr;</a>{% endif %}
+    </div>
 """
 
 POST_CONTENT = """
@@ -189,50 +226,166 @@ POST_CONTENT = """
     </div>
 """
 
+SEARCH_FILTERS = ("location", "role_category", "experience_level", "source_name")
+CATEGORIES = list(JobCategorizer.PATTERNS_ROLES) + ["Software Engineer"]
+EXPERIENCE_LEVELS = ["Fresher", "Experienced", "Unknown"]
+
+# Compiled once at startup instead of on every request
+INDEX_TEMPLATE = app.jinja_env.from_string(LAYOUT.replace("<!-- CONTENT_PLACEHOLDER -->", INDEX_CONTENT))
+POST_TEMPLATE = app.jinja_env.from_string(LAYOUT.replace("<!-- CONTENT_PLACEHOLDER -->", POST_CONTENT))
+# Part of every ETag, so a deploy with changed templates doesn't serve stale 304s
+TEMPLATE_VERSION = hashlib.md5((LAYOUT + INDEX_CONTENT + POST_CONTENT).encode("utf-8")).hexdigest()[:8]
+
+def _http_date(fetched_at: str):
+    # fetched_at is naive local time; astimezone() takes it as such
+    try:
+        return datetime.fromisoformat(fetched_at).astimezone()
+    except (TypeError, ValueError):
+        return None
+
+def _not_modified(etag: str, last_modified) -> bool:
+    return not is_resource_modified(request.environ, etag=etag, last_modified=last_modified)
+
+def _cached_response(body, etag: str, last_modified, max_age: int, mimetype: str = "text/html") -> Response:
+    # body is None for a 304
+    response = Response(body, status=200 if body is not None else 304, mimetype=mimetype)
+    response.set_etag(etag, weak=True)
+    response.last_modified = last_modified
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response
+
+def site_version(conn):
+    """(newest fetched_at, highest id): the listing pages can only change when one of them does."""
+    cursor = conn.cursor()
+    cursor.row_factory = None  # Plain tuple, not a Job
+    return cursor.execute(
+        "SELECT (SELECT MAX(fetched_at) FROM jobs), (SELECT MAX(id) FROM jobs)"
+    ).fetchone()
+
+def _listing_validators(newest, max_id):
+    """(ETag, Last-Modified) of a listing or API response for the current request."""
+    etag = hashlib.md5(f"{TEMPLATE_VERSION}|{newest}|{max_id}|{request.full_path}".encode("utf-8")).hexdigest()
+    return etag, _http_date(newest)
+
 @app.route('/')
 def index():
-    location_filter = request.args.get('location', '').strip()
+    q = request.args.get('q', '').strip()
+    filters = {name: request.args.get(name, '').strip() for name in SEARCH_FILTERS}
+    cursor = request.args.get('cursor')
     
-    conn = get_db_connection()
-    if location_filter:
-        query = "SELECT * FROM jobs WHERE location LIKE ? ORDER BY fetched_at DESC"
-        jobs = conn.execute(query, (f'%{location_filter}%',)).fetchall()
-    else:
-        jobs = conn.execute('SELECT * FROM jobs ORDER BY fetched_at DESC').fetchall()
-    conn.close()
+    with db_pool.connection() as conn:
+        # Revalidation is two index lookups; only render when a job was added since
+        newest, max_id = site_version(conn)
+        etag, last_modified = _listing_validators(newest, max_id)
+        if _not_modified(etag, last_modified):
+            return _cached_response(None, etag, last_modified, LOCAL_BLOG_LIST_MAX_AGE)
+        
+        # Full-text search (FTS5) plus facets, one page at a time (keyset cursor, no OFFSET)
+        jobs, next_cursor = search_jobs(conn, q, filters, cursor, LOCAL_BLOG_PAGE_SIZE)
+    
+    # Page links keep the search and filters
+    params = {name: value for name, value in [("q", q), *filters.items()] if value}
+    next_page = urlencode({**params, "cursor": next_cursor}) if next_cursor else None
     
-    # Inject content into layout
-    template = LAYOUT.replace("<!-- CONTENT_PLACEHOLDER -->", INDEX_CONTENT)
-    return render_template_string(template, title="Latest Jobs", posts=jobs, location_filter=location_filter)
+    html = INDEX_TEMPLATE.render(
+        title="Latest Jobs", posts=jobs, q=q, filters=filters, cursor=cursor,
+        next_page=next_page, first_page=urlencode(params),
+        categories=CATEGORIES, experience_levels=EXPERIENCE_LEVELS,
+    )
+    return _cached_response(html, etag, last_modified, LOCAL_BLOG_LIST_MAX_AGE)
 
-@app.route('/post/<job_hash>')
-def post(job_hash):
-    conn = get_db_connection()
-    row = conn.execute('SELECT * FROM jobs WHERE job_hash = ?', (job_hash,)).fetchone()
-    conn.close()
+def _api_error(message: str) -> Response:
+    return Response(dump({"error": message}), status=400, mimetype="application/json")
+
+def _since_id(conn, since: str) -> int:
+    """since= is a job id watermark (the "since" of an earlier response), or an ISO date/time for a first sync."""
+    if since.isdigit():
+        since_id = int(since)
+        if not in_sqlite_range(since_id):
+            raise ValueError(f"since out of range: {since}")
+        return since_id
+    fetched_at = datetime.fromisoformat(since)
+    if fetched_at.tzinfo is not None:
+        fetched_at = fetched_at.astimezone().replace(tzinfo=None)  # fetched_at is stored as naive local time
+    return first_id_after(conn, str(fetched_at))
+
+@app.route('/api/jobs')
+def api_jobs():
+    """
+    Jobs as compact JSON. Query parameters:
+      q, location, role_category,
+      experience_level, source_name   search and facet filters, as on the listing page
+      fields=title,apply_url,...      only these fields (default: all)
+      limit=N                         jobs per response (at most API_MAX_LIMIT)
+      cursor=...                      next page of the newest-first listing ("next_cursor")
+      since=<id or ISO time>          jobs added after that, oldest first. Poll again with the
+                                      returned "since" (until "has_more" is false) to get only
+                                      new jobs. Works with the exact facet filters only.
+    """
+    q = request.args.get('q', '').strip()
+    filters = {name: request.args.get(name, '').strip() for name in SEARCH_FILTERS}
+    since = request.args.get('since', '').strip()
+    try:
+        fields = parse_fields(request.args.get('fields'))
+    except ValueError as e:
+        return _api_error(str(e))  # Our own message, listing the valid fields
+    try:
+        limit = int(request.args.get('limit', API_DEFAULT_LIMIT))
+    except ValueError:
+        return _api_error(f"limit must be a whole number between 1 and {API_MAX_LIMIT}")
+    if not 1 <= limit <= API_MAX_LIMIT:
+        return _api_error(f"limit must be between 1 and {API_MAX_LIMIT}")
+    if since and (q or filters['location']):
+        return _api_error("since= can't be combined with q or location")
     
-    if row is None:
-        abort(404)
+    with db_pool.connection() as conn:
+        newest, max_id = site_version(conn)
+        etag, last_modified = _listing_validators(newest, max_id)
+        if _not_modified(etag, last_modified):
+            return _cached_response(None, etag, last_modified, LOCAL_BLOG_LIST_MAX_AGE, "application/json")
         
-    # Reconstruct Job object to use Formatter
-    from src.models import Job
-    job = Job(
-        title=row['title'],
-        company=row['company'],
-        location=row['location'],
-        experience_level=row['experience_level'],
-        role_category=row['role_category'],
-        apply_url=row['apply_url'],
-        source_name=row['source_name'],
-        fetched_at=row['fetched_at'], # Format might need adjustment if datetime is strict
-        job_hash=row['job_hash']
-    )
+        if since:
+            try:
+                since_id = _since_id(conn, since)
+            except ValueError:
+                return _api_error("since must be a job id or an ISO date/time")
+            jobs, has_more = sync_jobs(conn, since_id, filters, limit)
+            # Every matching job up to max_id has been returned once nothing more is waiting
+            next_since = jobs[-1].id if has_more else max(since_id, max_id or 0)
+            data = {"jobs": [job_to_dict(job, fields) for job in jobs], "since": next_since, "has_more": has_more}
+        else:
+            jobs, next_cursor = search_jobs(conn, q, filters, request.args.get('cursor'), limit)
+            # The first page's "since" lets a client switch to incremental sync after a full download
+            data = {"jobs": [job_to_dict(job, fields) for job in jobs], "next_cursor": next_cursor, "since": max_id or 0}
     
+    return _cached_response(dump(data), etag, last_modified, LOCAL_BLOG_LIST_MAX_AGE, "application/json")
+
+@lru_cache(maxsize=LOCAL_BLOG_POST_CACHE_SIZE)
+def render_post(job_hash):
+    """(html, fetched_at) of a job page. Raises KeyError for unknown jobs, so misses aren't cached."""
+    with db_pool.connection() as conn:
+        job = conn.execute(f'SELECT {JOB_SELECT} FROM jobs WHERE job_hash = ?', (job_hash,)).fetchone()
+    
+    if job is None:
+        raise KeyError(job_hash)
+        
     # Generate Blog Content
     blog_data = ContentFormatter.format_blog(job)
+    return POST_TEMPLATE.render(title=blog_data['title'], content=blog_data), job.fetched_at
+
+@app.route('/post/<job_hash>')
+def post(job_hash):
+    # A job page is fixed once written, so its ETag needs no DB lookup
+    etag = f"{TEMPLATE_VERSION}-{job_hash}"
+    if _not_modified(etag, None):
+        return _cached_response(None, etag, None, LOCAL_BLOG_POST_MAX_AGE)
     
-    template = LAYOUT.replace("<!-- CONTENT_PLACEHOLDER -->", POST_CONTENT)
-    return render_template_string(template, title=blog_data['title'], content=blog_data)
+    try:
+        html, fetched_at = render_post(job_hash)
+    except KeyError:
+        abort(404)
+    return _cached_response(html, etag, _http_date(fetched_at), LOCAL_BLOG_POST_MAX_AGE)
 
 if __name__ == '__main__':
     print("Starting Local Blog Preview on http://localhost:5050")
@@ -6,13 +6,18 @@ from src.db import DatabaseManager
 from src.fetchers.python_org import PythonOrgFetcher
 from src.fetchers.linkedin import LinkedInFetcher
 from src.fetchers.naukri import NaukriFetcher
+from src.fetchers.runner import run_fetchers
 from src.processors.filters import LocationFilter
-from src.processors.formatter import ContentFormatter
+from src.processors.dedup import NearDuplicateDetector
 from src.publishers.telegram import TelegramPublisher
 from src.publishers.blog import BlogPublisher
 from src.publishers.linkedin import LinkedInPublisher
+from src.publishers.pipeline import PublishPipeline
 from config.settings import FETCH_INTERVAL_MINUTES
 
+# Built once so its decision cache carries over from cycle to cycle
+location_filter = LocationFilter()
+
 def run_cycle():
     logger.info("Starting job fetch cycle...")
     
@@ -21,81 +26,45 @@ def run_cycle():
     
     # 2. Fetch Jobs
     fetchers = [
-        # PythonOrgFetcher(), # Can comment out to speed up or focus on specific source
-        LinkedInFetcher(),
+        # PythonOrgFetcher(known_hashes=db.get_known_hashes), # Can comment out to speed up or focus on specific source
+        LinkedInFetcher(known_hashes=db.get_known_hashes),
         # NaukriFetcher()
     ]
-    new_jobs_count = 0
-    
-    for fetcher in fetchers:
-        jobs = fetcher.fetch_jobs()
-        for job in jobs:
-            # Apply Location Filter
-            if not LocationFilter.is_allowed(job.location):
-                continue
-                
-            if db.save_job(job):
-                new_jobs_count += 1
+    # All sources run in parallel, each with its own deadline
+    jobs = run_fetchers(fetchers)
+
+    # Apply Location Filter, then store the whole batch in one transaction
+    allowed_jobs = [job for job in jobs if location_filter.is_allowed(job.location)]
+    location_filter.log_summary()
+    # Reposts and cross-posts get linked to the job we already have instead of being published again.
+    # Jobs already stored are skipped by save_jobs anyway, so only the unseen ones are checked.
+    known = db.get_known_hashes(job.job_hash for job in allowed_jobs)
+    NearDuplicateDetector(db.find_simhash_candidates).mark_duplicates(
+        job for job in allowed_jobs if job.job_hash not in known
+    )
+    new_hashes = db.save_jobs(allowed_jobs)
+    new_jobs_count = len(new_hashes)
     
     if new_jobs_count == 0:
         logger.info("No new jobs found this cycle, but checking for pending jobs...")
         # return  <-- Removed to allow processing pending jobs
 
     # 3. Process Pending Jobs
-    pending_jobs = db.get_pending_jobs()
-    logger.info(f"Processing {len(pending_jobs)} pending jobs...")
+    logger.info(f"Processing {db.count_pending_jobs()} pending jobs...")
     
     # Initialize Publishers
-    telegram = TelegramPublisher()
-    blog = BlogPublisher()
-    linkedin = LinkedInPublisher()
+    publishers = [TelegramPublisher(), BlogPublisher(), LinkedInPublisher()]
     
-    # Note: pending_jobs returns tuples from sqlite.
-    # We should ideally fetch them as objects or dicts. 
-    # For MVP, let's just re-fetch or assume index positions.
-    # Schema: id, job_hash, title, company, location, experience_level, 
-    #         role_category, apply_url, source_name, fetched_at, is_published, ...
-    
-    # To fix this, let's update db.py to return dicts or objects, 
-    # OR map manually here. 
-    # Let's simple query again or just use row indexing.
-    # Indices: 0-id, 1-hash, 2-title, 3-company, 4-location, 5-exp, 6-role, 7-url, 8-source
-    
-    for row in pending_jobs:
-        job_hash = row[1]
-        
-        # Reconstruct Job object loosely for formatters
-        # Ideally we load back into Job model
-        from src.models import Job
-        job = Job(
-            title=row[2],
-            company=row[3],
-            location=row[4],
-            experience_level=row[5],
-            role_category=row[6],
-            apply_url=row[7],
-            source_name=row[8],
-            job_hash=job_hash
-        )
-        
-        # Publish
-        tele_msg = ContentFormatter.format_telegram(job)
-        tele_status = "SUCCESS" if telegram.publish(tele_msg) else "SKIPPED/FAILED"
-        
-        blog_data = ContentFormatter.format_blog(job)
-        blog_status = "SUCCESS" if blog.publish(blog_data["title"], blog_data["content"], blog_data["tags"]) else "SKIPPED/FAILED"
-        
-        li_msg = ContentFormatter.format_linkedin(job)
-        li_status = "SUCCESS" if linkedin.publish(li_msg) else "SKIPPED/FAILED"
-        
-        # Mark as published
-        db.mark_published(job_hash, tele_status, blog_status)
+    # Every channel works through its own outbox rows in parallel, at its own rate limit.
+    # Failed posts stay in the outbox and are retried with backoff in later cycles.
+    outcomes = PublishPipeline(publishers, db).run()
+    logger.info(f"Publishing done: {dict(outcomes)}, outbox: {db.count_outbox_by_status()}")
 
     # Always rebuild static site at the end of cycle to ensure fresh content/timestamps
     logger.info("Triggering static site build...")
     try:
         from src.processors.static_generator import StaticSiteGenerator
-        generator = StaticSiteGenerator()
+        generator = StaticSiteGenerator(db=db)
         generator.build()
     except Exception as e:
         logger.error(f"Failed to build static site: {e}")
@@ -107,6 +76,10 @@ def main():
     parser.add_argument("--once", action="store_true", help="Run once and exit")
     args = parser.parse_args()
 
+    # A build killed mid-swap leaves no docs/ until the next build finishes, put the old site back now
+    from src.processors.static_generator import recover_interrupted_swap
+    recover_interrupted_swap()
+
     if args.once:
         run_cycle()
     else:
@@ -1,18 +1,109 @@
+import base64
+import json
+import os
+import queue
+import re
 import sqlite3
-from config.settings import DB_PATH
+import threading
+from contextlib import contextmanager
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from config.settings import DB_PATH, SQLITE_BUSY_TIMEOUT_MS, SQLITE_CACHE_SIZE_KB, SQLITE_MMAP_SIZE, DB_BATCH_SIZE
 from src.utils.logger import logger
 from src.models import Job
+from src.utils.known_hashes import KnownHashIndex, hash_key
+from src.processors.dedup import simhash, band_keys, block_key, job_band_keys, to_signed, to_unsigned
 
-class DatabaseManager:
-    def __init__(self, db_path=DB_PATH):
+def connect(db_path=DB_PATH, read_only: bool = False, check_same_thread: bool = True) -> sqlite3.Connection:
+    """
+    Opens a tuned SQLite connection. WAL lets readers (local_blog, the site
+    build) run while the scheduler writes; busy_timeout makes writers queue
+    up instead of failing with "database is locked".
+    """
+    conn = sqlite3.connect(db_path, timeout=SQLITE_BUSY_TIMEOUT_MS / 1000, check_same_thread=check_same_thread)
+    conn.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}")
+    if read_only:
+        # journal_mode is stored in the file, the writer side sets it
+        conn.execute("PRAGMA query_only = ON")
+    else:
+        conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")  # Durable across app crashes, fsyncs only at checkpoints in WAL mode
+    conn.execute(f"PRAGMA cache_size = -{SQLITE_CACHE_SIZE_KB}")
+    conn.execute(f"PRAGMA mmap_size = {SQLITE_MMAP_SIZE}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    return conn
+
+class ConnectionPool:
+    """
+    Fixed-size pool of read-only connections for request handlers. A
+    connection is only ever used by one thread at a time, but threads take
+    turns, hence check_same_thread=False.
+    """
+
+    def __init__(self, db_path=DB_PATH, size: int = 4, row_factory=None):
         self.db_path = db_path
-        self._init_db()
+        self.row_factory = row_factory
+        self._idle = queue.LifoQueue()  # Most recently used first: its page cache is warm
+        self._slots = threading.BoundedSemaphore(size)
 
-    def _get_connection(self):
-        return sqlite3.connect(self.db_path)
+    @contextmanager
+    def connection(self):
+        with self._slots:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = connect(self.db_path, read_only=True, check_same_thread=False)
+                conn.row_factory = self.row_factory
+            try:
+                yield conn
+            except sqlite3.Error:
+                # Don't hand a possibly broken connection to the next request
+                conn.close()
+                raise
+            else:
+                self._idle.put(conn)
 
-    def _init_db(self):
-        query = """
+# Columns needed to rebuild a Job. Select these instead of * and let job_row_factory map them.
+JOB_COLUMNS = (
+    "id", "job_hash", "title", "company", "location", "experience_level",
+    "role_category", "apply_url", "source_name", "fetched_at"
+)
+JOB_SELECT = ", ".join(JOB_COLUMNS)
+# Columns the site and search can be broken down by
+FACET_COLUMNS = ("role_category", "experience_level", "location", "source_name")
+# Facets filtered by exact value (location is matched by words instead)
+EXACT_FILTER_COLUMNS = ("role_category", "experience_level", "source_name")
+# Publish outbox states. Everything but PENDING is final.
+OUTBOX_PENDING = "PENDING"
+OUTBOX_SUCCESS = "SUCCESS"
+OUTBOX_SKIPPED = "SKIPPED"
+OUTBOX_FAILED = "FAILED"
+# Channels whose final outbox status is copied onto the jobs row
+CHANNEL_STATUS_COLUMNS = {"telegram": "telegram_status", "blog": "blog_status", "linkedin": "linkedin_status"}
+
+def job_row_factory(cursor, row) -> Job:
+    """sqlite3 row factory that yields Job objects (matched by column name, not position)."""
+    return Job(**{column[0]: value for column, value in zip(cursor.description, row)})
+
+def _index_existing_simhashes(conn):
+    """Signs every stored job and adds it to the band index (existing jobs all count as canonical)."""
+    rows = conn.execute("SELECT id, title, company, location FROM jobs").fetchall()
+    signed = []
+    keys = []
+    for job_id, title, company, location in rows:
+        signature = simhash(title)
+        signed.append((to_signed(signature), job_id))
+        keys.extend((band, key, job_id) for band, key in band_keys(signature, block_key(title, company, location)))
+    conn.executemany("UPDATE jobs SET simhash = ? WHERE id = ?", signed)
+    conn.executemany("INSERT OR IGNORE INTO job_simhash_bands (band, value, job_id) VALUES (?, ?, ?)", keys)
+
+# Schema migrations. MIGRATIONS[n] upgrades a database from user_version n to n + 1.
+# A step is either an SQL statement or a callable taking the connection (for data backfills).
+# Only ever append to this list; a shipped migration must not be edited.
+MIGRATIONS = [
+    # 1: Base jobs table (IF NOT EXISTS so databases created before migrations still upgrade)
+    [
+        """
         CREATE TABLE IF NOT EXISTS jobs (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             job_hash TEXT UNIQUE,
@@ -28,12 +119,333 @@ class DatabaseManager:
             telegram_status TEXT DEFAULT NULL,
             blog_status TEXT DEFAULT NULL,
             linkedin_status TEXT DEFAULT NULL
-        );
+        )
+        """,
+    ],
+    # 2: Indexes for the hot queries
+    [
+        # Pending jobs are a small slice of the table, a partial index only holds those rows
+        "CREATE INDEX IF NOT EXISTS idx_jobs_pending ON jobs (fetched_at) WHERE is_published = 0",
+        # Newest-first listings (site build, local blog). Walked backwards it yields
+        # ORDER BY fetched_at DESC, id DESC without a sort, since the rowid is part of every index key
+        "CREATE INDEX IF NOT EXISTS idx_jobs_fetched_at ON jobs (fetched_at)",
+    ],
+    # 3: Publish outbox, one row per (job, channel). Times are unix timestamps.
+    [
+        """
+        CREATE TABLE IF NOT EXISTS publish_outbox (
+            job_hash TEXT NOT NULL,
+            channel TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'PENDING',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            next_attempt_at REAL NOT NULL DEFAULT 0,
+            last_error TEXT,
+            updated_at REAL,
+            PRIMARY KEY (job_hash, channel)
+        ) WITHOUT ROWID
+        """,
+        # Due rows per channel, oldest first; finished rows drop out of the index
+        "CREATE INDEX IF NOT EXISTS idx_outbox_due ON publish_outbox (channel, next_attempt_at) WHERE status = 'PENDING'",
+    ],
+    # 4: Near-duplicate detection. Duplicates point at their canonical job; only canonical
+    #    jobs are in the LSH band index (one key per band, see src/processors/dedup.py).
+    [
+        "ALTER TABLE jobs ADD COLUMN simhash INTEGER",
+        "ALTER TABLE jobs ADD COLUMN canonical_hash TEXT",
+        """
+        CREATE TABLE IF NOT EXISTS job_simhash_bands (
+            band INTEGER NOT NULL,
+            value INTEGER NOT NULL,
+            job_id INTEGER NOT NULL,
+            PRIMARY KEY (band, value, job_id)
+        ) WITHOUT ROWID
+        """,
+        _index_existing_simhashes,
+    ],
+    # 5: Full-text search over title/company/location/category (external content: the
+    #    text lives in jobs, the FTS table only holds the index). Triggers keep it in sync.
+    [
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+            title, company, location, role_category,
+            content = 'jobs', content_rowid = 'id',
+            tokenize = "unicode61 tokenchars '+#'",
+            prefix = '2 3 4'
+        )
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+            INSERT INTO jobs_fts (rowid, title, company, location, role_category)
+            VALUES (new.id, new.title, new.company, new.location, new.role_category);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, company, location, role_category)
+            VALUES ('delete', old.id, old.title, old.company, old.location, old.role_category);
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS jobs_fts_update AFTER UPDATE OF title, company, location, role_category ON jobs BEGIN
+            INSERT INTO jobs_fts (jobs_fts, rowid, title, company, location, role_category)
+            VALUES ('delete', old.id, old.title, old.company, old.location, old.role_category);
+            INSERT INTO jobs_fts (rowid, title, company, location, role_category)
+            VALUES (new.id, new.title, new.company, new.location, new.role_category);
+        END
+        """,
+        "INSERT INTO jobs_fts (jobs_fts) VALUES ('rebuild')",
+    ],
+]
+
+# Bound parameters allowed per statement by SQLite before 3.32 (still the system library on some LTS distros)
+SQLITE_MAX_VARIABLES = 999
+
+# Listings, counts and search only show canonical jobs
+CANONICAL = "canonical_hash IS NULL"
+
+def keyset_page(conn, where: str = "", params=(), after: tuple = None, limit: int = DB_BATCH_SIZE,
+                newest_first: bool = True) -> List[Job]:
+    """One page of jobs ordered by (fetched_at, id), starting right after the `after` key."""
+    direction, comparison = ("DESC", "<") if newest_first else ("ASC", ">")
+    conditions = [where] if where else []
+    params = list(params)
+    if after is not None:
+        conditions.append(f"(fetched_at, id) {comparison} (?, ?)")
+        params.extend(after)
+
+    query = f"SELECT {JOB_SELECT} FROM jobs"
+    if conditions:
+        query += " WHERE " + " AND ".join(f"({c})" for c in conditions)
+    query += f" ORDER BY fetched_at {direction}, id {direction} LIMIT ?"
+    params.append(limit)
+
+    cursor = conn.cursor()
+    cursor.row_factory = job_row_factory
+    return cursor.execute(query, params).fetchall()
+
+def encode_cursor(job: Job) -> str:
+    """Opaque page token for 'jobs after this one' (its keyset position)."""
+    return base64.urlsafe_b64encode(json.dumps([str(job.fetched_at), job.id]).encode("utf-8")).decode("ascii")
+
+def in_sqlite_range(value: int) -> bool:
+    """Whether an int fits an SQLite INTEGER (signed 64-bit); binding a bigger one raises OverflowError."""
+    return -(1 << 63) <= value < 1 << 63
+
+def decode_cursor(cursor: Optional[str]) -> Optional[tuple]:
+    """Keyset position from a page token; None for a missing or malformed token (= first page)."""
+    if not cursor:
+        return None
+    try:
+        fetched_at, job_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        job_id = int(job_id)
+    except (ValueError, TypeError, OverflowError):  # int(1e999) overflows
+        return None
+    return (str(fetched_at), job_id) if in_sqlite_range(job_id) else None
+
+def fts_query(text: str, column: str = None, prefix_last: bool = True) -> Optional[str]:
+    """
+    Free text -> FTS5 MATCH expression: every word must match (as a quoted
+    string, so user input can't inject FTS syntax); the last word also
+    matches as a prefix while typing. None if there are no words.
+    """
+    words = re.findall(r"[\w+#]+", (text or "").lower())
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    if prefix_last:
+        terms[-1] += "*"
+    expression = " ".join(terms)
+    return f"{column} : ({expression})" if column else expression
+
+def search_jobs(conn, q: str = "", filters: dict = None, cursor: str = None,
+                limit: int = DB_BATCH_SIZE) -> Tuple[List[Job], Optional[str]]:
+    """
+    Newest-first page of (canonical) jobs matching free text `q` and the
+    facet filters. role_category / experience_level / source_name match
+    exactly; location matches words of the location (so "Remote" or
+    "Bengaluru" work against "Bengaluru, Karnataka, India"). Returns
+    (jobs, cursor of the next page or None).
+
+    Text searches walk the FTS index backwards by rowid and stop after one
+    page, instead of collecting every match and sorting it. That is the
+    same order as (fetched_at, id) because save_jobs inserts in fetched_at
+    order, so the id half of the cursor is all the seek needs.
+    """
+    filters = filters or {}
+    after = decode_cursor(cursor)
+    conditions, params = _exact_filters(filters)
+
+    matches = [fts_query(q)]
+    if filters.get("location"):
+        matches.append(fts_query(filters["location"], column="location", prefix_last=False))
+    matches = [match for match in matches if match]
+
+    # One extra row tells us whether there is a next page
+    if matches:
+        columns = ", ".join(f"jobs.{column}" for column in JOB_COLUMNS)
+        seek = "AND jobs_fts.rowid < ?" if after else ""
+        query = f"""
+            SELECT {columns} FROM jobs_fts JOIN jobs ON jobs.id = jobs_fts.rowid
+            WHERE jobs_fts MATCH ? {seek} AND {" AND ".join(f"jobs.{c}" for c in conditions)}
+            ORDER BY jobs_fts.rowid DESC LIMIT ?
+        """
+        query_params = [" AND ".join(f"({match})" for match in matches)]
+        if after:
+            query_params.append(after[1])
+        db_cursor = conn.cursor()
+        db_cursor.row_factory = job_row_factory
+        rows = db_cursor.execute(query, query_params + params + [limit + 1]).fetchall()
+    else:
+        rows = keyset_page(conn, " AND ".join(conditions), params, after, limit + 1)
+
+    page = rows[:limit]
+    return page, encode_cursor(page[-1]) if len(rows) > limit else None
+
+def sync_jobs(conn, since_id: int = 0, filters: dict = None,
+              limit: int = DB_BATCH_SIZE) -> Tuple[List[Job], bool]:
+    """
+    (Canonical) jobs added after job id `since_id`, oldest first, for
+    incremental sync: ids only grow (AUTOINCREMENT) and rows are never
+    changed, so the last id a client has seen is a complete watermark.
+    Supports the exact facet filters. Returns (jobs, whether more are waiting).
+    """
+    conditions, params = _exact_filters(filters or {})
+    conditions.append("id > ?")
+    params.append(since_id)
+    cursor = conn.cursor()
+    cursor.row_factory = job_row_factory
+    rows = cursor.execute(
+        f"SELECT {JOB_SELECT} FROM jobs WHERE {' AND '.join(conditions)} ORDER BY id LIMIT ?",
+        params + [limit + 1]
+    ).fetchall()
+    return rows[:limit], len(rows) > limit
+
+def first_id_after(conn, fetched_at: str) -> int:
+    """
+    Watermark for 'jobs fetched after this time' (fetched_at as stored,
+    str(datetime)): the id just before the first of them.
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    first_id, = cursor.execute("SELECT MIN(id) FROM jobs WHERE fetched_at > ?", (fetched_at,)).fetchone()
+    if first_id is not None:
+        return first_id - 1
+    return cursor.execute("SELECT COALESCE(MAX(id), 0) FROM jobs").fetchone()[0]
+
+def _exact_filters(filters: dict) -> Tuple[List[str], list]:
+    conditions, params = [CANONICAL], []
+    for column in EXACT_FILTER_COLUMNS:
+        if filters.get(column):
+            conditions.append(f"{column} = ?")
+            params.append(filters[column])
+    return conditions, params
+
+def run_migrations(conn):
+    """Brings the schema up to date by running every migration newer than PRAGMA user_version."""
+    while True:
+        with conn:
+            # Lock first and re-read the version, another process may be migrating too
+            conn.execute("BEGIN IMMEDIATE")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= len(MIGRATIONS):
+                break
+            for step in MIGRATIONS[version]:
+                if callable(step):
+                    step(conn)
+                else:
+                    conn.execute(step)
+            conn.execute(f"PRAGMA user_version = {version + 1}")
+        logger.info(f"Migrated database to schema version {version + 1}")
+    logger.info("Database initialized successfully.")
+
+def migrate(db_path=DB_PATH):
+    """Runs the migrations on a short-lived connection, for processes that only read (local_blog)."""
+    conn = connect(db_path)
+    try:
+        # Already current: don't take the write lock (the file may be read-only for this process)
+        if conn.execute("PRAGMA user_version").fetchone()[0] < len(MIGRATIONS):
+            run_migrations(conn)
+    finally:
+        conn.close()
+
+# One long-lived connection per thread and DB file. sqlite3 connections must not
+# be shared across threads, and the fetch/publish stages run in thread pools.
+_local = threading.local()
+_initialized_paths = set()
+_init_lock = threading.Lock()
+# In-memory index of every stored job hash, per DB file (see KnownHashIndex)
+_known_indexes = {}
+
+class DatabaseManager:
+    def __init__(self, db_path=DB_PATH):
+        self.db_path = str(db_path)
+        # Schema setup only needs to happen once per process, not per manager
+        with _init_lock:
+            if self.db_path not in _initialized_paths:
+                self._init_db()
+                _initialized_paths.add(self.db_path)
+            self.known = _known_indexes.get(self.db_path)
+            if self.known is None:
+                self.known = _known_indexes[self.db_path] = self._load_known_hashes()
+
+    @property
+    def _known_snapshot_path(self) -> str:
+        return f"{os.path.splitext(self.db_path)[0]}.hashes"
+
+    def _load_known_hashes(self) -> KnownHashIndex:
+        """Loads the snapshot and catches up on rows inserted after it (or reads every hash if there's none)."""
+        index = KnownHashIndex.load(self._known_snapshot_path)
+        conn = self._get_connection()
+        if index is not None and not self._snapshot_matches(conn, index):
+            logger.info("Known-hash snapshot doesn't match the database, rebuilding it")
+            index = None
+        if index is None:
+            index = KnownHashIndex()
+        rows = conn.execute("SELECT job_hash FROM jobs WHERE id > ?", (index.high_water_id,))
+        index.update((row[0] for row in rows), *self._newest_row(conn))
+        logger.info(f"Loaded {len(index)} known job hashes")
+        return index
+
+    @staticmethod
+    def _snapshot_matches(conn, index: KnownHashIndex) -> bool:
+        """
+        Whether the snapshot was taken of this database: the row at its
+        high-water id must have the same hash, and there must be exactly as
+        many rows up to it as the snapshot holds keys. A restored backup, a
+        replaced or rewritten DB file fails one of the two.
         """
+        if index.high_water_id == 0:
+            return len(index) == 0
+        row = conn.execute("SELECT job_hash FROM jobs WHERE id = ?", (index.high_water_id,)).fetchone()
+        if row is None or hash_key(row[0]) != index.high_water_key:
+            return False
+        rows = conn.execute("SELECT COUNT(*) FROM jobs WHERE id <= ?", (index.high_water_id,)).fetchone()[0]
+        return rows == len(index)
+
+    @staticmethod
+    def _newest_row(conn):
+        """(id, job_hash) of the newest row, (0, None) for an empty table."""
+        return conn.execute("SELECT id, job_hash FROM jobs ORDER BY id DESC LIMIT 1").fetchone() or (0, None)
+
+    def _get_connection(self):
+        connections = getattr(_local, "connections", None)
+        if connections is None:
+            connections = _local.connections = {}
+        conn = connections.get(self.db_path)
+        if conn is None:
+            conn = connections[self.db_path] = connect(self.db_path)
+        return conn
+
+    def close(self):
+        """Closes the calling thread's connection (a new one is opened on next use)."""
+        connections = getattr(_local, "connections", {})
+        conn = connections.pop(self.db_path, None)
+        if conn is not None:
+            conn.close()
+
+    def _init_db(self):
         try:
-            with self._get_connection() as conn:
-                conn.execute(query)
-                logger.info("Database initialized successfully.")
+            run_migrations(self._get_connection())
         except Exception as e:
             logger.error(f"Failed to initialize database: {e}")
 
@@ -42,50 +454,267 @@ class DatabaseManager:
         Saves a job if it doesn't already exist.
         Returns True if saved, False if duplicate.
         """
-        if not job.job_hash:
-            job.generate_hash()
-            
+        return bool(self.save_jobs([job]))
+
+    def save_jobs(self, jobs: Iterable[Job]) -> List[str]:
+        """
+        Saves many jobs in a single transaction (one fsync for the whole batch).
+        Returns the hashes of the jobs that were actually new, in input order.
+        """
+        batch = []
+        batch_hashes = set()
+        for job in jobs:
+            if not job.job_hash:
+                job.generate_hash()
+            if job.job_hash in batch_hashes:
+                continue
+            batch_hashes.add(job.job_hash)
+            batch.append(job)
+
+        # Known jobs (most of what every fetch sees) are rejected without touching SQLite
+        total = len(batch)
+        batch = [job for job in batch if job.job_hash not in self.known]
+        if not batch:
+            logger.info(f"Saved 0 new jobs ({total} already known)")
+            return []
+        batch_hashes = {job.job_hash for job in batch}
+
+        # Near-duplicates are stored (linked to their canonical job) but never published
         query = """
-        INSERT INTO jobs (
+        INSERT OR IGNORE INTO jobs (
             job_hash, title, company, location, experience_level, 
-            role_category, apply_url, source_name, fetched_at
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            role_category, apply_url, source_name, fetched_at,
+            simhash, canonical_hash, is_published
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
         try:
             with self._get_connection() as conn:
-                conn.execute(query, (
-                    job.job_hash, job.title, job.company, job.location,
-                    job.experience_level, job.role_category, job.apply_url,
-                    job.source_name, job.fetched_at
-                ))
-            logger.info(f"Saved new job: {job.title} at {job.company}")
-            return True
-        except sqlite3.IntegrityError:
-            # Duplicate job hash
-            return False
+                # Take the write lock up front so nobody can insert between our lookup and our insert
+                conn.execute("BEGIN IMMEDIATE")
+                known = self._select_known_hashes(conn, list(batch_hashes))
+                new_jobs = [job for job in batch if job.job_hash not in known]
+                # Inserted oldest first, so row ids follow fetched_at (search pages by id, see search_jobs)
+                conn.executemany(query, [
+                    (
+                        job.job_hash, job.title, job.company, job.location,
+                        job.experience_level, job.role_category, job.apply_url,
+                        job.source_name, job.fetched_at,
+                        to_signed(job.simhash) if job.simhash is not None else None,
+                        job.canonical_hash, 1 if job.canonical_hash else 0
+                    )
+                    for job in sorted(new_jobs, key=lambda job: str(job.fetched_at))
+                ])
+                conn.executemany(
+                    "INSERT OR IGNORE INTO job_simhash_bands (band, value, job_id) SELECT ?, ?, id FROM jobs WHERE job_hash = ?",
+                    [
+                        (band, value, job.job_hash)
+                        for job in new_jobs if job.simhash is not None and not job.canonical_hash
+                        for band, value in job_band_keys(job)
+                    ],
+                )
+                max_id, max_hash = self._newest_row(conn)
         except Exception as e:
-            logger.error(f"Error saving job: {e}")
-            return False
-            
-    def get_pending_jobs(self):
-        """Fetch jobs that haven't been published yet."""
-        query = "SELECT * FROM jobs WHERE is_published = 0"
+            logger.error(f"Error saving jobs: {e}")
+            return []
+
+        self.known.update((job.job_hash for job in batch), max_id, max_hash)
+        if new_jobs:
+            self.known.save(self._known_snapshot_path)
+        logger.info(f"Saved {len(new_jobs)} new jobs ({total - len(new_jobs)} already known)")
+        return [job.job_hash for job in new_jobs]
+
+    def get_known_hashes(self, hashes) -> set:
+        """Returns the subset of the given job hashes that are already stored (answered from memory)."""
+        return {job_hash for job_hash in hashes if job_hash in self.known}
+
+    @staticmethod
+    def _select_known_hashes(conn, hashes: list) -> set:
+        known = set()
+        # Stay under SQLite's bound-parameter limit
+        for i in range(0, len(hashes), SQLITE_MAX_VARIABLES):
+            chunk = hashes[i:i + SQLITE_MAX_VARIABLES]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(f"SELECT job_hash FROM jobs WHERE job_hash IN ({placeholders})", chunk)
+            known.update(row[0] for row in rows)
+        return known
+
+    def find_simhash_candidates(self, job_bands) -> Dict[tuple, List[tuple]]:
+        """
+        {(band, value): [(job_hash, signature)]} of canonical jobs sharing a
+        band key with the given ones. Meant for a whole batch: the keys are
+        looked up as many at a time as one statement can bind instead of one
+        query per job.
+        """
+        job_bands = list(dict.fromkeys(job_bands))
+        candidates = {}
+        conn = self._get_connection()
+        per_query = SQLITE_MAX_VARIABLES // 2  # Two parameters per band key
+        for i in range(0, len(job_bands), per_query):
+            chunk = job_bands[i:i + per_query]
+            conditions = " OR ".join(["(b.band = ? AND b.value = ?)"] * len(chunk))
+            rows = conn.execute(
+                f"""
+                SELECT b.band, b.value, j.job_hash, j.simhash FROM job_simhash_bands b
+                JOIN jobs j ON j.id = b.job_id
+                WHERE {conditions}
+                """,
+                [part for band in chunk for part in band],
+            )
+            for band, value, job_hash, signature in rows:
+                candidates.setdefault((band, value), []).append((job_hash, to_unsigned(signature)))
+        return candidates
+
+    def _iter_keyset(self, where: str = "", params: tuple = (), newest_first: bool = True,
+                     batch_size: int = DB_BATCH_SIZE) -> Iterator[Job]:
+        """
+        Streams Job objects ordered by (fetched_at, id) with keyset pagination:
+        every batch is a fresh indexed query that starts right after the last
+        row of the previous one. Memory stays at one batch however big the
+        table is, and rows updated while we iterate (e.g. marked published)
+        can't make us skip or repeat anything.
+        """
+        last_key = None
+        while True:
+            batch = keyset_page(self._get_connection(), where, params, last_key, batch_size, newest_first)
+            yield from batch
+
+            if len(batch) < batch_size:
+                return
+            last_key = (batch[-1].fetched_at, batch[-1].id)
+
+    def search_jobs(self, q: str = "", filters: dict = None, cursor: str = None,
+                    limit: int = DB_BATCH_SIZE) -> Tuple[List[Job], Optional[str]]:
+        return search_jobs(self._get_connection(), q, filters, cursor, limit)
+
+    def iter_jobs(self, batch_size: int = DB_BATCH_SIZE) -> Iterator[Job]:
+        """All (canonical) jobs, newest first."""
+        return self._iter_keyset(CANONICAL, batch_size=batch_size)
+
+    def iter_pending_jobs(self, batch_size: int = DB_BATCH_SIZE) -> Iterator[Job]:
+        """Jobs that haven't been published yet, oldest first."""
+        return self._iter_keyset("is_published = 0", newest_first=False, batch_size=batch_size)
+
+    def count_pending_jobs(self) -> int:
+        return self._get_connection().execute("SELECT COUNT(*) FROM jobs WHERE is_published = 0").fetchone()[0]
+
+    def count_jobs(self) -> int:
+        return self._get_connection().execute(f"SELECT COUNT(*) FROM jobs WHERE {CANONICAL}").fetchone()[0]
+
+    def count_jobs_by(self, column: str) -> dict:
+        """Number of jobs per distinct value of a facet column, in one grouped query."""
+        if column not in FACET_COLUMNS:
+            raise ValueError(f"Not a facet column: {column}")
+        rows = self._get_connection().execute(f"SELECT {column}, COUNT(*) FROM jobs WHERE {CANONICAL} GROUP BY {column}")
+        return dict(rows.fetchall())
+
+    def get_job(self, job_hash: str) -> Optional[Job]:
+        cursor = self._get_connection().cursor()
+        cursor.row_factory = job_row_factory
+        return cursor.execute(f"SELECT {JOB_SELECT} FROM jobs WHERE job_hash = ?", (job_hash,)).fetchone()
+
+    def enqueue_pending_jobs(self, channels: Iterable[str]) -> int:
+        """
+        Adds an outbox row for every unpublished job and channel that doesn't
+        have one yet. Returns how many rows were added.
+        """
+        now = time.time()
+        with self._get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            before = conn.total_changes
+            for channel in channels:
+                conn.execute(
+                    """
+                    INSERT OR IGNORE INTO publish_outbox (job_hash, channel, next_attempt_at, updated_at)
+                    SELECT job_hash, ?, 0, ? FROM jobs WHERE is_published = 0
+                    """,
+                    (channel, now),
+                )
+            return conn.total_changes - before
+
+    def claim_outbox(self, channel: str, limit: int, lease_seconds: float) -> List[Tuple[Job, int]]:
+        """
+        Claims up to `limit` due outbox rows of a channel, oldest first, and
+        returns them as (job, attempts so far). Claimed rows are leased: their
+        next attempt moves lease_seconds ahead, so other workers skip them and
+        rows of a crashed run come back on their own once the lease runs out.
+        """
+        now = time.time()
         with self._get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
             cursor = conn.cursor()
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            # Convert rows to dict or objects if needed, for MVP returning raw rows is fine or simple dicts
-            return rows
+            cursor.row_factory = job_row_factory
+            rows = conn.execute(
+                """
+                SELECT job_hash, attempts FROM publish_outbox
+                WHERE channel = ? AND status = 'PENDING' AND next_attempt_at <= ?
+                ORDER BY next_attempt_at LIMIT ?
+                """,
+                (channel, now, limit),
+            ).fetchall()
+            if not rows:
+                return []
+            conn.executemany(
+                "UPDATE publish_outbox SET next_attempt_at = ?, updated_at = ? WHERE job_hash = ? AND channel = ?",
+                [(now + lease_seconds, now, job_hash, channel) for job_hash, _ in rows],
+            )
+            attempts = dict(rows)
+            hashes = list(attempts)
+            jobs = []
+            for i in range(0, len(hashes), SQLITE_MAX_VARIABLES):
+                chunk = hashes[i:i + SQLITE_MAX_VARIABLES]
+                jobs.extend(cursor.execute(
+                    f"SELECT {JOB_SELECT} FROM jobs WHERE job_hash IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall())
+        jobs.sort(key=lambda job: (str(job.fetched_at), job.id))
+        return [(job, attempts[job.job_hash]) for job in jobs]
 
-    def mark_published(self, job_hash, telegram_status=None, blog_status=None):
-        query = """
-        UPDATE jobs 
-        SET is_published = 1, telegram_status = ?, blog_status = ? 
-        WHERE job_hash = ?
+    def release_outbox(self, channel: str, job_hashes: Iterable[str]):
+        """Hands claimed rows back unattempted (due again right away)."""
+        with self._get_connection() as conn:
+            conn.executemany(
+                "UPDATE publish_outbox SET next_attempt_at = 0 WHERE job_hash = ? AND channel = ? AND status = 'PENDING'",
+                [(job_hash, channel) for job_hash in job_hashes],
+            )
+
+    def record_publish_attempt(self, job_hash: str, channel: str, status: str,
+                               error: Optional[str] = None, retry_at: Optional[float] = None) -> bool:
         """
-        try:
-            with self._get_connection() as conn:
-                conn.execute(query, (telegram_status, blog_status, job_hash))
-            logger.info(f"Marked job {job_hash} as published.")
-        except Exception as e:
-            logger.error(f"Failed to update publish status for {job_hash}: {e}")
+        Records one publish attempt. With retry_at the row stays PENDING and is
+        due again at that time; otherwise `status` is final. Once every channel
+        of the job is final the job is marked published and the per-channel
+        statuses are copied onto it. Returns True when that happened.
+        """
+        now = time.time()
+        if retry_at is not None:
+            status = OUTBOX_PENDING
+        with self._get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                """
+                UPDATE publish_outbox
+                SET status = ?, attempts = attempts + 1, next_attempt_at = ?, last_error = ?, updated_at = ?
+                WHERE job_hash = ? AND channel = ?
+                """,
+                (status, retry_at if retry_at is not None else now, error, now, job_hash, channel),
+            )
+            if status == OUTBOX_PENDING:
+                return False
+
+            statuses = dict(conn.execute(
+                "SELECT channel, status FROM publish_outbox WHERE job_hash = ?", (job_hash,)
+            ).fetchall())
+            if OUTBOX_PENDING in statuses.values():
+                return False
+
+            columns = {column: statuses.get(name) for name, column in CHANNEL_STATUS_COLUMNS.items()}
+            assignments = ", ".join(f"{column} = ?" for column in columns)
+            conn.execute(
+                f"UPDATE jobs SET is_published = 1, {assignments} WHERE job_hash = ?",
+                [*columns.values(), job_hash],
+            )
+        logger.info(f"Finished publishing job {job_hash}: {statuses}")
+        return True
+
+    def count_outbox_by_status(self) -> dict:
+        rows = self._get_connection().execute("SELECT status, COUNT(*) FROM publish_outbox GROUP BY status")
+        return dict(rows.fetchall())
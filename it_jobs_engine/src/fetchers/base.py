@@ -1,32 +1,121 @@
+import threading
+import time
 import requests
 from abc import ABC, abstractmethod
 from fake_useragent import UserAgent
-from config.settings import USER_AGENT, REQUEST_TIMEOUT
+from config.settings import USER_AGENT, REQUEST_TIMEOUT, FETCH_SOURCE_DEADLINE_SECONDS, HTTP_CACHE_ENABLED, HTML_FAST_PARSE
 from src.utils.logger import logger
+from src.utils.http import get_session, request_deadline
+from src.utils.http_cache import get_response_cache
 from src.models import Job
 from typing import List
 
+# fetch_page result for a page the server says is unchanged and whose jobs are all stored already
+NOT_MODIFIED = object()
+
 class BaseFetcher(ABC):
-    def __init__(self, source_name: str, base_url: str):
+    def __init__(self, source_name: str, base_url: str, deadline_seconds: float = FETCH_SOURCE_DEADLINE_SECONDS,
+                 cache=None, known_hashes=None):
+        """
+        known_hashes: optional callable taking a list of job hashes and returning
+        the subset we already have (e.g. DatabaseManager.get_known_hashes).
+        """
         self.source_name = source_name
+        self.known_hashes = known_hashes
         self.base_url = base_url
+        self.deadline_seconds = deadline_seconds
+        self._deadline = None
+        self._results = []
+        self._results_lock = threading.Lock()
+        self.cache = cache if cache is not None else (get_response_cache() if HTTP_CACHE_ENABLED else None)
         self.ua = UserAgent()
-        
+        self.fast_parse = HTML_FAST_PARSE
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled keep-alive session (with retry/backoff) for this source's host."""
+        return get_session(self.base_url)
+
     def _get_headers(self):
         return {
             "User-Agent": self.ua.random
         }
 
-    def fetch_page(self, url: str):
+    def start_deadline(self):
+        """Starts the per-source clock (and a fresh partial_results list). Called by the fetch runner's worker right before fetch_jobs()."""
+        self._deadline = time.monotonic() + self.deadline_seconds
+        with self._results_lock:
+            self._results = []
+
+    def add_results(self, jobs: List[Job]):
+        """
+        Multi-request fetchers hand over each page's jobs as they go, so the
+        runner can keep them if the source misses its deadline.
+        """
+        with self._results_lock:
+            self._results.extend(jobs)
+
+    def partial_results(self) -> List[Job]:
+        with self._results_lock:
+            return list(self._results)
+
+    def time_remaining(self) -> float:
+        if self._deadline is None:
+            return float(self.deadline_seconds)
+        return max(0.0, self._deadline - time.monotonic())
+
+    def deadline_exceeded(self) -> bool:
+        """Multi-request fetchers should check this between requests and return what they have."""
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    def _request_timeout(self) -> float:
+        # Never let a single request outlive the source deadline
+        return max(1.0, min(REQUEST_TIMEOUT, self.time_remaining()))
+
+    def fetch_page(self, url: str, headers: dict = None):
+        """
+        Returns the page body, or None on error. On a 304 it returns
+        NOT_MODIFIED if every job the page held (see remember_jobs) is stored
+        already, so the caller can skip parsing it. Otherwise (some were never
+        saved: source past its deadline, failed save, crash) it returns the
+        cached body to parse again.
+        """
+        request_headers = {**self._get_headers(), **(headers or {})}
+        cached = self.cache.get(url) if self.cache else None
+        if cached:
+            request_headers.update(self.cache.conditional_headers(cached))
+
         try:
             # SSL verification disabled for local dev environment compatibility
-            response = requests.get(url, headers=self._get_headers(), timeout=REQUEST_TIMEOUT, verify=False)
+            with request_deadline(self._deadline):
+                response = get_session(url).get(url, headers=request_headers, timeout=self._request_timeout(), verify=False)
+            if response.status_code == 304 and cached:
+                self.cache.mark_fresh(url, cached)
+                return NOT_MODIFIED if self._all_stored(cached.get("job_hashes")) else cached["body"]
             response.raise_for_status()
-            return response.text
         except requests.RequestException as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
 
+        if self.cache:
+            self.cache.put(url, response)
+        return response.text
+
+    def remember_jobs(self, url: str, jobs: List[Job]):
+        """Stores the hashes of the jobs parsed from url with its cache entry."""
+        if not self.cache:
+            return
+        for job in jobs:
+            if not job.job_hash:
+                job.generate_hash()
+        self.cache.set_job_hashes(url, [job.job_hash for job in jobs])
+
+    def _all_stored(self, job_hashes) -> bool:
+        # Without the page's hashes (or a way to look them up) we can't tell, so parse it
+        if job_hashes is None or self.known_hashes is None:
+            return False
+        return set(self.known_hashes(job_hashes)) >= set(job_hashes)
+
     @abstractmethod
     def fetch_jobs(self) -> List[Job]:
         """
@@ -1,20 +1,115 @@
-import requests
-from bs4 import BeautifulSoup
-from src.fetchers.base import BaseFetcher
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import SoupStrainer
+from src.fetchers.base import BaseFetcher, NOT_MODIFIED
 from src.models import Job
 from src.processors.categorizer import JobCategorizer
 from src.utils.logger import logger
+from src.utils.soup import make_soup, find_first
+from config.settings import (
+    LINKEDIN_KEYWORDS, LINKEDIN_LOCATIONS, LINKEDIN_PAGE_SIZE,
+    LINKEDIN_MAX_PAGES, LINKEDIN_MAX_CONCURRENCY
+)
 import urllib.parse
 
+# seeMoreJobPostings returns a bare list of <li> cards
+CARD_STRAINER = SoupStrainer("li")
+CARD_FIELDS = {
+    "title": ("h3", "base-search-card__title"),
+    "company": ("h4", "base-search-card__subtitle"),
+    "location": ("span", "job-search-card__location"),
+    "link": ("a", "base-card__full-link"),
+}
+
 class LinkedInFetcher(BaseFetcher):
-    def __init__(self):
-        # Public jobs search URL
-        super().__init__("LinkedIn", "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?keywords=Software%20Engineer&location=India&start=0")
-        
+    def __init__(self, known_hashes=None, keywords=None, locations=None,
+                 max_pages=LINKEDIN_MAX_PAGES, max_concurrency=LINKEDIN_MAX_CONCURRENCY):
+        """
+        known_hashes: see BaseFetcher. Also used to stop paginating a query
+        once a page holds only stored jobs.
+        """
+        # Public jobs search endpoint
+        super().__init__(
+            "LinkedIn", "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search",
+            known_hashes=known_hashes,
+        )
+        self.keywords = keywords or LINKEDIN_KEYWORDS
+        self.locations = locations or LINKEDIN_LOCATIONS
+        self.max_pages = max_pages
+        self.max_concurrency = max_concurrency
+        self._seen = set()
+        self._seen_lock = threading.Lock()
+
+    def _search_url(self, keywords: str, location: str, start: int) -> str:
+        params = {"keywords": keywords, "location": location, "start": start}
+        return f"{self.base_url}?{urllib.parse.urlencode(params, quote_via=urllib.parse.quote)}"
+
     def fetch_jobs(self):
-        jobs = []
         logger.info("Starting LinkedIn static fetch...")
-        
+        self._seen = set()
+
+        queries = [(kw, loc) for kw in self.keywords for loc in self.locations]
+        jobs = []
+        # Pages of a single query are walked in order (so we can stop early),
+        # different queries run side by side.
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="linkedin") as pool:
+            for query_jobs in pool.map(lambda q: self._walk_query(*q), queries):
+                jobs.extend(query_jobs)
+
+        logger.info(f"Fetched {len(jobs)} jobs from LinkedIn across {len(queries)} queries")
+        return jobs
+
+    def _walk_query(self, keywords: str, location: str):
+        jobs = []
+        for page in range(self.max_pages):
+            if self.deadline_exceeded():
+                logger.warning(f"LinkedIn deadline reached, stopping '{keywords}' in {location} at page {page}")
+                break
+
+            url = self._search_url(keywords, location, page * LINKEDIN_PAGE_SIZE)
+            html = self._fetch_search_page(url)
+            if html is None:
+                break
+            if html is NOT_MODIFIED:
+                # Same page as last time and all its jobs are stored: nothing new here or after it
+                logger.info(f"LinkedIn page {page} of '{keywords}' in {location} not modified. Stopping early.")
+                break
+
+            page_jobs = self._parse_cards(html)
+            self.remember_jobs(url, page_jobs)
+            if not page_jobs:
+                # Ran past the last page of results
+                break
+
+            new_jobs, all_stored = self._claim_new(page_jobs)
+            jobs.extend(new_jobs)
+            self.add_results(new_jobs)
+            # Only the DB says we've caught up: jobs another query claimed this cycle are
+            # still unsaved, and the pages after them can hold jobs nobody has seen yet
+            if all_stored:
+                logger.info(f"LinkedIn page {page} of '{keywords}' in {location} has only known jobs. Stopping early.")
+                break
+
+        return jobs
+
+    def _claim_new(self, page_jobs):
+        """
+        Drops jobs already in the DB or already picked up by another query this
+        cycle. Returns (the remaining jobs, whether every job on the page is in the DB).
+        """
+        hashes = [job.job_hash for job in page_jobs]
+        known = set(self.known_hashes(hashes)) if self.known_hashes else set()
+
+        new_jobs = []
+        with self._seen_lock:
+            for job in page_jobs:
+                if job.job_hash in known or job.job_hash in self._seen:
+                    continue
+                self._seen.add(job.job_hash)
+                new_jobs.append(job)
+        return new_jobs, all(job_hash in known for job_hash in hashes)
+
+    def _fetch_search_page(self, url: str):
         # LinkedIn strict about headers
         headers = {
             "User-Agent": self.ua.random,
@@ -22,56 +117,51 @@ class LinkedInFetcher(BaseFetcher):
             "Accept-Language": "en-US,en;q=0.5",
         }
 
-        try:
-            # Note: We use the 'seeMoreJobPostings' API endpoint which returns HTML fragments of job cards.
-            # It's cleaner than the full search page.
-            response = requests.get(self.base_url, headers=headers, timeout=10, verify=False)
-            
-            if response.status_code != 200:
-                logger.warning(f"LinkedIn fetch failed with status {response.status_code}")
-                return []
-                
-            soup = BeautifulSoup(response.text, "html.parser")
-            job_cards = soup.find_all("li")
-            
-            logger.info(f"Found {len(job_cards)} potential job cards on LinkedIn")
-            
-            for card in job_cards:
-                try:
-                    title_tag = card.find("h3", class_="base-search-card__title")
-                    company_tag = card.find("h4", class_="base-search-card__subtitle")
-                    location_tag = card.find("span", class_="job-search-card__location")
-                    link_tag = card.find("a", class_="base-card__full-link")
-                    
-                    if not (title_tag and company_tag and link_tag):
-                        continue
-                        
-                    title = title_tag.get_text(strip=True)
-                    company = company_tag.get_text(strip=True)
-                    location = location_tag.get_text(strip=True) if location_tag else "Remote"
-                    apply_url = link_tag["href"]
-                    
-                    # Clean URL
-                    if "?" in apply_url:
-                        apply_url = apply_url.split("?")[0]
-                        
-                    role, experience = JobCategorizer.categorize(title)
-                    
-                    job = Job(
-                        title=title,
-                        company=company,
-                        location=location,
-                        apply_url=apply_url,
-                        source_name="LinkedIn",
-                        role_category=role,
-                        experience_level=experience
-                    )
-                    jobs.append(job)
-                except Exception as e:
+        # Note: We use the 'seeMoreJobPostings' API endpoint which returns HTML fragments of job cards.
+        # It's cleaner than the full search page.
+        return self.fetch_page(url, headers=headers)
+
+    def _parse_cards(self, html: str):
+        jobs = []
+        soup = make_soup(html, CARD_STRAINER, self.fast_parse)
+        job_cards = soup.find_all("li")
+
+        for card in job_cards:
+            try:
+                # One walk over the card instead of a find() scan per field
+                tags = find_first(card, CARD_FIELDS)
+                title_tag = tags.get("title")
+                company_tag = tags.get("company")
+                location_tag = tags.get("location")
+                link_tag = tags.get("link")
+
+                if not (title_tag and company_tag and link_tag):
                     continue
-                    
-        except Exception as e:
-            logger.error(f"Error fetching LinkedIn: {e}")
-            
-        logger.info(f"Fetched {len(jobs)} jobs from LinkedIn")
+
+                title = title_tag.get_text(strip=True)
+                company = company_tag.get_text(strip=True)
+                location = location_tag.get_text(strip=True) if location_tag else "Remote"
+                apply_url = link_tag["href"]
+
+                # Clean URL
+                if "?" in apply_url:
+                    apply_url = apply_url.split("?")[0]
+
+                job = Job(
+                    title=title,
+                    company=company,
+                    location=location,
+                    apply_url=apply_url,
+                    source_name="LinkedIn"
+                )
+                job.generate_hash()
+                jobs.append(job)
+            except Exception as e:
+                continue
+
+        # Categorize the whole page at once
+        for job, (role, experience) in zip(jobs, JobCategorizer.categorize_many(job.title for job in jobs)):
+            job.role_category = role
+            job.experience_level = experience
+
         return jobs
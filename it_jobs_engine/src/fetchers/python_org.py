@@ -1,21 +1,38 @@
 import urllib.parse
-from bs4 import BeautifulSoup
-from src.fetchers.base import BaseFetcher
+from bs4 import SoupStrainer
+from src.fetchers.base import BaseFetcher, NOT_MODIFIED
 from src.models import Job
 from src.processors.categorizer import JobCategorizer
 from src.utils.logger import logger
+from src.utils.soup import make_soup, find_first, has_class
+
+# Everything but the job list (header, navigation, sidebar, footer) is skipped
+LISTING_STRAINER = SoupStrainer("ol", class_=has_class("list-recent-jobs"))
+ITEM_FIELDS = {
+    "name": ("span", "listing-company-name"),
+    "location": ("span", "listing-location"),
+}
 
 class PythonOrgFetcher(BaseFetcher):
-    def __init__(self):
-        super().__init__("Python.org", "https://www.python.org/jobs/")
+    def __init__(self, known_hashes=None):
+        super().__init__("Python.org", "https://www.python.org/jobs/", known_hashes=known_hashes)
         
     def fetch_jobs(self):
-        jobs = []
         html = self.fetch_page(self.base_url)
+        if html is NOT_MODIFIED:
+            logger.info("Python.org jobs page unchanged since last fetch. Skipping parse.")
+            return []
         if not html:
             return []
             
-        soup = BeautifulSoup(html, "html.parser")
+        jobs = self._parse_listing(html)
+        self.remember_jobs(self.base_url, jobs)
+        logger.info(f"Fetched {len(jobs)} jobs from Python.org")
+        return jobs
+
+    def _parse_listing(self, html: str):
+        jobs = []
+        soup = make_soup(html, LISTING_STRAINER, self.fast_parse)
         job_list = soup.find("ol", class_="list-recent-jobs")
         
         if not job_list:
@@ -24,13 +41,15 @@ class PythonOrgFetcher(BaseFetcher):
             
         for item in job_list.find_all("li"):
             try:
-                title_tag = item.find("span", class_="listing-company-name").find("a")
+                # One walk over the item finds both spans
+                tags = find_first(item, ITEM_FIELDS)
+                name_tag = tags.get("name")
+                title_tag = name_tag.find("a")
                 title = title_tag.text.strip()
                 apply_path = title_tag["href"]
                 # Use urllib.parse.urljoin to handle relative vs absolute paths correctly
                 apply_url = urllib.parse.urljoin(self.base_url, apply_path)
                 
-                company_tag = item.text.strip().split("\n")
                 # Python.org structure is a bit nested, let's parse carefully
                 # Structure:
                 # <span class="listing-company-name">
@@ -41,29 +60,28 @@ class PythonOrgFetcher(BaseFetcher):
                 # Let's adjust based on typical structure.
                 # Actually, the 'listing-company-name' contains the title anchor and company text.
                 
-                company_text = item.find("span", class_="listing-company-name").get_text(strip=True)
+                company_text = name_tag.get_text(strip=True)
                 # company_text usually looks like "Job TitleCompany Name" if no space.
                 # Let's try to extract company name by removing title.
                 company = company_text.replace(title, "").strip()
                 
-                location = item.find("span", class_="listing-location").text.strip()
-                
-                # Categorize
-                role, experience = JobCategorizer.categorize(title)
+                location = tags.get("location").text.strip()
                 
                 job = Job(
                     title=title,
                     company=company,
                     location=location,
                     apply_url=apply_url,
-                    source_name=self.source_name,
-                    role_category=role,
-                    experience_level=experience
+                    source_name=self.source_name
                 )
                 jobs.append(job)
             except Exception as e:
                 logger.error(f"Error parsing job item: {e}")
                 continue
                 
-        logger.info(f"Fetched {len(jobs)} jobs from Python.org")
+        # Categorize the whole page at once
+        for job, (role, experience) in zip(jobs, JobCategorizer.categorize_many(job.title for job in jobs)):
+            job.role_category = role
+            job.experience_level = experience
+            
         return jobs
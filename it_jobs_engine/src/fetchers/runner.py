@@ -0,0 +1,69 @@
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import List
+from config.settings import FETCH_MAX_WORKERS
+from src.fetchers.base import BaseFetcher
+from src.models import Job
+from src.utils.logger import logger
+
+# Extra time allowed past a source's deadline for its last in-flight request to return
+DEADLINE_GRACE_SECONDS = 1.0
+
+def _run_fetcher(fetcher: BaseFetcher, picked_up: threading.Event) -> List[Job]:
+    # The clock starts when a worker picks the source up, not while it waits in the queue
+    fetcher.start_deadline()
+    picked_up.set()
+    return fetcher.fetch_jobs()
+
+def run_fetchers(fetchers: List[BaseFetcher], max_workers=FETCH_MAX_WORKERS) -> List[Job]:
+    """
+    Runs every fetcher in parallel and returns the jobs of all sources. A
+    source that misses its own deadline (or crashes) only contributes the
+    jobs it handed over with add_results() so far, so the cycle takes as long
+    as the slowest source instead of the sum of all of them.
+    """
+    if not fetchers:
+        return []
+
+    started = time.monotonic()
+    workers = max_workers or len(fetchers)
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetcher")
+    # Sources that keep to their deadlines free a worker within deadline + grace, so even the
+    # last queued source gets one by then. Past it, a hung source is holding the worker for good.
+    rounds = math.ceil(len(fetchers) / workers)
+    start_by = started + rounds * (max(f.deadline_seconds for f in fetchers) + DEADLINE_GRACE_SECONDS)
+    futures = []
+    for fetcher in fetchers:
+        picked_up = threading.Event()
+        futures.append((fetcher, picked_up, executor.submit(_run_fetcher, fetcher, picked_up)))
+
+    jobs = []
+    try:
+        for fetcher, picked_up, future in futures:
+            # With fewer workers than sources, a source may still be queued behind others
+            if not picked_up.wait(timeout=max(0.0, start_by - time.monotonic())):
+                future.cancel()
+                logger.warning(f"{fetcher.source_name} never got a worker, the sources before it overran. Skipping it this cycle.")
+                continue
+            try:
+                result = future.result(timeout=fetcher.time_remaining() + DEADLINE_GRACE_SECONDS)
+            except FutureTimeoutError:
+                result = fetcher.partial_results()
+                logger.warning(
+                    f"{fetcher.source_name} missed its {fetcher.deadline_seconds}s deadline. "
+                    f"Keeping the {len(result)} jobs it fetched so far."
+                )
+            except Exception as e:
+                result = fetcher.partial_results()
+                logger.error(f"{fetcher.source_name} fetcher crashed: {e}. Keeping the {len(result)} jobs it fetched so far.")
+
+            jobs.extend(result or [])
+            logger.info(f"{fetcher.source_name}: {len(result or [])} jobs in {time.monotonic() - started:.1f}s")
+    finally:
+        # Don't block the cycle on a source that is still hanging past its deadline
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    logger.info(f"Fetched {len(jobs)} jobs from {len(fetchers)} sources in {time.monotonic() - started:.1f}s")
+    return jobs
@@ -14,6 +14,9 @@ class Job:
     role_category: str = "Other"
     fetched_at: datetime = field(default_factory=datetime.now)
     job_hash: str = ""
+    id: Optional[int] = None  # Row id, set when loaded from the DB
+    simhash: Optional[int] = None  # Near-duplicate signature (src/processors/dedup.py)
+    canonical_hash: Optional[str] = None  # Set when this is a repost / cross-post of that job
 
     def __post_init__(self):
         # Allow passing existing hash, or generate if empty
@@ -0,0 +1,81 @@
+import json
+from collections import Counter, defaultdict
+from typing import Sequence, Tuple
+from src.models import Job
+from src.db import EXACT_FILTER_COLUMNS
+from config.settings import API_PAGE_SIZE
+
+API_DIR = "api"
+API_VERSION = 1
+# Fields a client can pick with fields=, in output order
+API_FIELDS = (
+    "id", "job_hash", "title", "company", "location", "experience_level",
+    "role_category", "apply_url", "source_name", "fetched_at"
+)
+
+def parse_fields(text: str) -> Tuple[str, ...]:
+    """fields= value ("title,company") -> field names in API_FIELDS order. Empty means all; unknown names raise ValueError."""
+    requested = {name.strip() for name in (text or "").split(",") if name.strip()}
+    unknown = requested - set(API_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}. Available: {', '.join(API_FIELDS)}")
+    return tuple(name for name in API_FIELDS if name in requested) or API_FIELDS
+
+def job_to_dict(job: Job, fields: Sequence[str] = API_FIELDS) -> dict:
+    return {name: str(job.fetched_at) if name == "fetched_at" else getattr(job, name) for name in fields}
+
+def dump(data) -> str:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+class ApiExportBuilder:
+    """
+    Static counterpart of local_blog's /api/jobs, for docs/api/:
+      index.json     job count, latest id, facet counts and the list of pages
+      jobs/<n>.json  jobs with ids n * page_size ... (n + 1) * page_size - 1, oldest first
+
+    Pages are keyed by id range (like the search document shards) and job
+    rows never change, so once a later id exists a page is complete and its
+    bytes stay the same in every build. A client keeps the last id it has
+    seen as its watermark and only fetches index.json and the pages from
+    watermark // page_size on.
+    """
+
+    def __init__(self, page_size: int = API_PAGE_SIZE):
+        self.page_size = page_size
+        self.pages = defaultdict(list)  # Page number -> rows (tuples in API_FIELDS order, not dicts: less memory)
+        self.facets = {column: Counter() for column in EXACT_FILTER_COLUMNS}
+        self.latest_id = 0
+        self.count = 0
+
+    def add(self, job: Job):
+        self.pages[job.id // self.page_size].append(tuple(job_to_dict(job).values()))
+        for column, counts in self.facets.items():
+            counts[getattr(job, column)] += 1
+        self.latest_id = max(self.latest_id, job.id)
+        self.count += 1
+
+    def files(self):
+        """Yields (path under the site root, JSON content) for every export file."""
+        pages = []
+        for number in sorted(self.pages):
+            rows = sorted(self.pages[number])  # By id, the first field
+            path = f"jobs/{number}.json"
+            pages.append({
+                "page": number,
+                "path": path,
+                "first_id": rows[0][0],
+                "last_id": rows[-1][0],
+                "count": len(rows),
+                "complete": self.latest_id >= (number + 1) * self.page_size - 1,
+            })
+            yield f"{API_DIR}/{path}", dump({"page": number, "jobs": [dict(zip(API_FIELDS, row)) for row in rows]})
+
+        yield f"{API_DIR}/index.json", dump({
+            "version": API_VERSION,
+            "jobs": self.count,
+            "latest_id": self.latest_id,
+            "page_size": self.page_size,
+            "fields": list(API_FIELDS),
+            "facets": {column: dict(counts.most_common()) for column, counts in self.facets.items()},
+            "pages": pages,
+        })
@@ -1,7 +1,16 @@
 import re
+from functools import lru_cache
+from typing import Iterable, List
+
+# Distinct titles remembered by categorize(). The same titles repost constantly.
+CACHE_SIZE = 4096
+
+def _compile_any(patterns) -> re.Pattern:
+    """One regex matching if any of the patterns match (same result as any(re.search(p) ...))."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns))
 
 class JobCategorizer:
-    
+
     PATTERNS_ROLES = {
         "Backend": [r"backend", r"python", r"django", r"flask", r"node", r"java", r"golang", r"ruby"],
         "Frontend": [r"frontend", r"react", r"angular", r"vue", r"javascript", r"typescript", r"css", r"html"],
@@ -10,30 +19,52 @@ class JobCategorizer:
         "Data/AI": [r"data", r"machine learning", r"ai", r"analytics", r"pandas", r"numpy", r"tensor", r"pytorch"],
         "QA/Automation": [r"qa", r"quality assurance", r"automation", r"tester", r"selenium", r"pytest"],
     }
-    
+
     PATTERNS_EXP = {
         "Fresher": [r"fresher", r"entry level", r"junior", r"graduate", r"0-", r"0\+ years", r"intern"],
         "Experienced": [r"senior", r"lead", r"principal", r"architect", r"[2-9]\+ years", r"10\+ years"],
     }
 
+    # Compiled once. Roles are still tried in dict order, so first-match-wins is unchanged.
+    ROLE_REGEXES = [(category, _compile_any(patterns)) for category, patterns in PATTERNS_ROLES.items()]
+    FRESHER_REGEX = _compile_any(PATTERNS_EXP["Fresher"])
+    EXPERIENCED_REGEX = _compile_any(PATTERNS_EXP["Experienced"])
+
     @staticmethod
     def categorize(title: str, description: str = "") -> tuple[str, str]:
         """
         Returns (Role Category, Experience Level)
         """
-        text = f"{title} {description}".lower()
-        
+        return JobCategorizer._categorize_text(f"{title} {description}".lower())
+
+    @staticmethod
+    def categorize_many(titles: Iterable[str]) -> List[tuple[str, str]]:
+        """
+        Categorizes a whole page of titles at once, in input order.
+        Repeated titles on the page are only matched once.
+        """
+        results = {}
+        output = []
+        for title in titles:
+            if title not in results:
+                results[title] = JobCategorizer.categorize(title)
+            output.append(results[title])
+        return output
+
+    @staticmethod
+    @lru_cache(maxsize=CACHE_SIZE)
+    def _categorize_text(text: str) -> tuple[str, str]:
         role = "Software Engineer"
-        for category, patterns in JobCategorizer.PATTERNS_ROLES.items():
-            if any(re.search(p, text) for p in patterns):
+        for category, regex in JobCategorizer.ROLE_REGEXES:
+            if regex.search(text):
                 role = category
                 break  # Simplistic first-match wins
-                
+
         experience = "Unknown"
         # Check Fresher first as it's more specific sometimes
-        if any(re.search(p, text) for p in JobCategorizer.PATTERNS_EXP["Fresher"]):
+        if JobCategorizer.FRESHER_REGEX.search(text):
             experience = "Fresher"
-        elif any(re.search(p, text) for p in JobCategorizer.PATTERNS_EXP["Experienced"]):
+        elif JobCategorizer.EXPERIENCED_REGEX.search(text):
             experience = "Experienced"
-            
+
         return role, experience
@@ -0,0 +1,146 @@
+import hashlib
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from src.models import Job
+from src.processors.filters import normalize_location
+from src.utils.logger import logger
+
+SIMHASH_BITS = 64
+# 4 bands of 16 bits: two signatures within 3 differing bits always agree on at least
+# one whole band (pigeonhole), so looking up the 4 band keys finds every near-duplicate.
+BANDS = 4
+BAND_BITS = SIMHASH_BITS // BANDS
+MAX_DISTANCE = BANDS - 1
+SHINGLE_SIZE = 3
+
+# Words that don't tell two postings apart
+TITLE_NOISE = {"a", "an", "and", "the", "for", "of", "in", "at", "with", "to", "job", "jobs", "opening", "hiring", "urgent", "remote", "hybrid", "wfh"}
+COMPANY_SUFFIXES = {"pvt", "private", "ltd", "limited", "inc", "llc", "llp", "corp", "corporation", "co", "company", "gmbh", "plc"}
+# Seniority is never fuzzy: "Software Engineer II" is not a repost of "Software Engineer"
+LEVEL_WORDS = {"intern", "trainee", "junior", "jr", "senior", "sr", "lead", "principal", "staff", "head", "i", "ii", "iii", "iv", "1", "2", "3", "4"}
+WORD_ALIASES = {"sr": "senior", "jr": "junior", "fullstack": "full stack", "js": "javascript"}
+
+def _words(text: str) -> List[str]:
+    return re.findall(r"[a-z0-9+#]+", (text or "").lower())
+
+def _stem(word: str) -> str:
+    # Plurals only ("Engineers", "Developers"), enough for job titles
+    return word[:-1] if len(word) > 3 and word.endswith("s") and not word.endswith("ss") else word
+
+def normalize_title(title: str) -> List[str]:
+    """Title words without noise, singular and sorted, so word order and punctuation don't matter."""
+    words = " ".join(WORD_ALIASES.get(word, word) for word in _words(title)).split()
+    return sorted({_stem(word) for word in words if word not in TITLE_NOISE})
+
+def normalize_company(company: str) -> str:
+    return " ".join(word for word in _words(company) if word not in COMPANY_SUFFIXES)
+
+def block_key(title: str, company: str, location: str) -> str:
+    """Exact part of the match: near-duplicates have the same company, city and seniority."""
+    levels = [word for word in normalize_title(title) if word in LEVEL_WORDS]
+    return f"{normalize_company(company)}|{normalize_location(location).lower()}|{' '.join(levels)}"
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.md5(feature.encode("utf-8")).digest()[:8], "big")
+
+def simhash(title: str) -> int:
+    """64-bit SimHash of the normalized title's character shingles (the fuzzy part of the match)."""
+    text = f" {' '.join(normalize_title(title))} "
+    features = {text[i:i + SHINGLE_SIZE] for i in range(max(1, len(text) - SHINGLE_SIZE + 1))}
+
+    weights = [0] * SIMHASH_BITS
+    for feature in features:
+        value = _feature_hash(feature)
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    signature = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            signature |= 1 << bit
+    return signature
+
+def band_keys(signature: int, block: str) -> List[Tuple[int, int]]:
+    """
+    (band number, key) pairs stored in the LSH index. A key is one 16-bit
+    slice of the signature hashed together with the block, so only jobs of
+    the same company / city / seniority ever share a bucket.
+    """
+    mask = (1 << BAND_BITS) - 1
+    return [
+        (band, to_signed(_feature_hash(f"{block}|{band}|{signature >> (band * BAND_BITS) & mask}")))
+        for band in range(BANDS)
+    ]
+
+def job_band_keys(job: Job) -> List[Tuple[int, int]]:
+    return band_keys(job.simhash, block_key(job.title, job.company, job.location))
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+# SQLite integers are signed 64-bit
+def to_signed(value: int) -> int:
+    return value - (1 << SIMHASH_BITS) if value >= 1 << (SIMHASH_BITS - 1) else value
+
+def to_unsigned(value: int) -> int:
+    return value + (1 << SIMHASH_BITS) if value < 0 else value
+
+class NearDuplicateDetector:
+    """
+    Finds reposts and cross-source copies of jobs we already have: same
+    company, city and seniority, and a title SimHash within max_distance bits.
+    find_candidates(band keys) -> {band key: [(job_hash, signature)]} looks up
+    canonical jobs sharing a band key (DatabaseManager.find_simhash_candidates).
+    It's called once per batch, and each lookup touches a handful of rows
+    instead of the whole table.
+    """
+
+    def __init__(self, find_candidates: Callable[[List[Tuple[int, int]]], Dict[Tuple[int, int], List[Tuple[str, int]]]],
+                 max_distance: int = MAX_DISTANCE):
+        self.find_candidates = find_candidates
+        self.max_distance = max_distance
+
+    def mark_duplicates(self, jobs: Iterable[Job]) -> int:
+        """
+        Sets job.simhash on every job and job.canonical_hash on near-duplicates
+        (of stored jobs or of earlier jobs in the same batch). Returns how many
+        duplicates were found. Pass only jobs that aren't stored yet, known
+        ones would just be looked up for nothing.
+        """
+        jobs = list(jobs)
+        bands_by_job = []
+        for job in jobs:
+            if not job.job_hash:
+                job.generate_hash()
+            job.simhash = simhash(job.title)
+            bands_by_job.append(job_band_keys(job))
+        stored = self.find_candidates([band for job_bands in bands_by_job for band in job_bands]) if jobs else {}
+
+        batch_index = {}  # band key -> [(job_hash, signature)] of this batch's canonical jobs
+        duplicates = 0
+        for job, job_bands in zip(jobs, bands_by_job):
+            candidates = []
+            for band in job_bands:
+                candidates.extend(stored.get(band, ()))
+                candidates.extend(batch_index.get(band, ()))
+            job.canonical_hash = self._closest(job, candidates)
+
+            if job.canonical_hash:
+                duplicates += 1
+            else:
+                for band in job_bands:
+                    batch_index.setdefault(band, []).append((job.job_hash, job.simhash))
+
+        if duplicates:
+            logger.info(f"Found {duplicates} near-duplicate jobs (reposts / cross-posts)")
+        return duplicates
+
+    def _closest(self, job: Job, candidates) -> Optional[str]:
+        best = None
+        for job_hash, signature in candidates:
+            if job_hash == job.job_hash:
+                continue  # Exactly the same posting, save_jobs already skips it
+            distance = hamming_distance(job.simhash, signature)
+            if distance <= self.max_distance and (best is None or distance < best[0]):
+                best = (distance, job_hash)
+        return best[1] if best else None
@@ -1,11 +1,63 @@
+import re
+from collections import Counter
+from functools import lru_cache
 from config.settings import ALLOWED_LOCATIONS, BLOCKED_LOCATIONS
 from src.utils.logger import logger
 
+# Spellings that should land on the same archive page
+LOCATION_ALIASES = {
+    "bangalore": "Bengaluru",
+    "bangalore urban": "Bengaluru",
+    "bengaluru east": "Bengaluru",
+    "gurgaon": "Gurugram",
+    "new delhi": "Delhi",
+    "bombay": "Mumbai",
+}
+
+def normalize_location(location_str: str) -> str:
+    """
+    Reduces a raw location to its city (or country / "Remote"), e.g.
+    "Bangalore Urban, Karnataka, India" -> "Bengaluru".
+    """
+    if not location_str:
+        return "Unknown"
+    city = location_str.split(",")[0].strip()
+    if not city:
+        return "Unknown"
+    return LOCATION_ALIASES.get(city.lower(), city)
+
 class LocationFilter:
+    """
+    Build once and reuse: the allow/block lists are lowercased and compiled
+    up front, and decisions are cached per distinct location string (the
+    same few hundred strings repeat every cycle). Rejections are counted
+    instead of logged one by one; call log_summary() once per cycle.
+    """
+
+    def __init__(self, allowed_locations=ALLOWED_LOCATIONS, blocked_locations=BLOCKED_LOCATIONS,
+                 cache_size: int = 4096):
+        self.allowed_locations = list(allowed_locations or [])
+        self.blocked_locations = list(blocked_locations or [])
+        self._blocked_regex = self._compile(self.blocked_locations)
+        self._allowed_regex = self._compile(self.allowed_locations)
+        self._blocked_names = {blocked.lower(): blocked for blocked in self.blocked_locations}
+        self._decide = lru_cache(maxsize=cache_size)(self._evaluate)
+
+        self.checked = 0
+        self.rejections = Counter()
+
     @staticmethod
-    def is_allowed(location_str: str) -> bool:
+    def _compile(keywords):
+        """Plain (case-insensitive) substring match against any keyword, in a single pass."""
+        if not keywords:
+            return None
+        # Longest first, so the reported keyword is the most specific one
+        ordered = sorted({keyword.lower() for keyword in keywords}, key=len, reverse=True)
+        return re.compile("|".join(re.escape(keyword) for keyword in ordered))
+
+    def _evaluate(self, location_str: str):
         """
-        Returns True if the location is allowed based on settings.
+        Returns (allowed, rejection reason).
         Algorithm:
         1. If BLOCKED_LOCATIONS match -> False
         2. If ALLOWED_LOCATIONS is empty -> True (Allow all)
@@ -13,24 +65,40 @@ class LocationFilter:
         4. Else -> False
         """
         if not location_str:
-            return False
-            
+            return False, "Missing location"
+
         loc_normalized = location_str.lower()
-        
+
         # 1. Check Blocklist
-        if BLOCKED_LOCATIONS:
-            for blocked in BLOCKED_LOCATIONS:
-                if blocked.lower() in loc_normalized:
-                    logger.info(f"Filtered out job location '{location_str}' (Blocked: {blocked})")
-                    return False
-        
+        if self._blocked_regex:
+            match = self._blocked_regex.search(loc_normalized)
+            if match:
+                return False, f"Blocked: {self._blocked_names[match.group(0)]}"
+
         # 2. Check Whitelist
-        if not ALLOWED_LOCATIONS:
-            return True
-            
-        for allowed in ALLOWED_LOCATIONS:
-            if allowed.lower() in loc_normalized:
-                return True
-                
-        logger.info(f"Filtered out job location '{location_str}' (Not in allowed list)")
-        return False
+        if not self._allowed_regex:
+            return True, None
+
+        if self._allowed_regex.search(loc_normalized):
+            return True, None
+
+        return False, "Not in allowed list"
+
+    def is_allowed(self, location_str: str) -> bool:
+        """Returns True if the location is allowed based on settings."""
+        allowed, reason = self._decide(location_str)
+        self.checked += 1
+        if not allowed:
+            self.rejections[reason] += 1
+        return allowed
+
+    def log_summary(self):
+        """Logs this cycle's rejection counts as one line and resets them."""
+        rejected = sum(self.rejections.values())
+        if rejected:
+            reasons = ", ".join(f"{reason}: {count}" for reason, count in self.rejections.most_common())
+            logger.info(f"Location filter rejected {rejected} of {self.checked} jobs ({reasons})")
+        else:
+            logger.info(f"Location filter accepted all {self.checked} jobs")
+        self.checked = 0
+        self.rejections.clear()
@@ -1,5 +1,10 @@
+import html
+from typing import List, Tuple
 from src.models import Job
 
+# Telegram rejects messages longer than this (counted after HTML parsing, so raw length is a safe bound)
+TELEGRAM_MAX_MESSAGE_LENGTH = 4096
+
 class ContentFormatter:
     
     @staticmethod
@@ -70,3 +75,52 @@ class ContentFormatter:
             "#Hiring #Jobs #TechJobs #Career #Opportunity"
         )
         return msg
+
+    @staticmethod
+    def format_telegram_digest(jobs: List[Job], max_length: int = TELEGRAM_MAX_MESSAGE_LENGTH) -> List[Tuple[str, List[Job]]]:
+        """
+        Packs many jobs into as few Telegram messages as possible, grouped by
+        role category, one line (and link) per job. Returns (message, jobs in
+        that message) pairs; every message stays within max_length.
+        """
+        messages = []
+        lines, message_jobs, length, section = [], [], 0, None
+
+        for job in sorted(jobs, key=lambda job: job.role_category or "Other"):
+            category = job.role_category or "Other"
+            header = f"\U0001F4BC <b>{html.escape(category)} Jobs</b>"
+            line = ContentFormatter._telegram_digest_line(job, max_length - len(header) - 2)
+            # A new section costs its header plus the blank line before it
+            cost = len(line) + 1 + (0 if section == category else len(header) + 2)
+            if message_jobs and length + cost > max_length:
+                messages.append(("\n".join(lines), message_jobs))
+                lines, message_jobs, length, section = [], [], 0, None
+            if section != category:
+                # A category continued in the next message repeats its header
+                lines.extend([""] if lines else [])
+                lines.append(header)
+                length += len(header) + 2
+                section = category
+            lines.append(line)
+            message_jobs.append(job)
+            length += len(line) + 1
+
+        if message_jobs:
+            messages.append(("\n".join(lines), message_jobs))
+        return messages
+
+    @staticmethod
+    def _telegram_digest_line(job: Job, max_length: int) -> str:
+        """'• Title — Company, Location (Experience)' with the title linking to the job."""
+        details = html.escape(f" \u2014 {job.company}, {job.location} ({job.experience_level})")
+        link_start = f"\u2022 <a href='{html.escape(job.apply_url or '', quote=True)}'>"
+        title = html.escape(job.title or "")
+        # Never split an entity or the link: drop the details, then shorten the title
+        if len(link_start) + len(title) + len("</a>") + len(details) > max_length:
+            details = ""
+        raw_title = job.title or ""
+        while len(link_start) + len(title) + len("</a>") > max_length and raw_title:
+            # An escaped character takes up to 6 characters, so don't cut more than overflow / 6 at a time
+            raw_title = raw_title[:-((len(link_start) + len(title) + len("</a>") - max_length) // 6 + 1)]
+            title = html.escape(raw_title) + "\u2026"
+        return f"{link_start}{title}</a>{details}"
@@ -0,0 +1,190 @@
+import re
+import json
+from collections import defaultdict
+from src.models import Job
+
+TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+STOPWORDS = {"a", "an", "and", "at", "for", "in", "of", "on", "or", "the", "to", "with"}
+MAX_TOKEN_LENGTH = 30
+
+# Keep these in sync with SEARCH_SCRIPT below
+PREFIX_LENGTH = 2
+DOCS_PER_SHARD = 1000
+INDEX_DIR = "search"
+
+def tokenize(text: str):
+    return [
+        token for token in TOKEN_RE.findall((text or "").lower())
+        if token not in STOPWORDS and len(token) <= MAX_TOKEN_LENGTH
+    ]
+
+def shard_name(token: str) -> str:
+    """Terms are sharded by their first PREFIX_LENGTH characters ('_' for anything not [a-z0-9])."""
+    return re.sub(r"[^a-z0-9]", "_", (token + "_" * PREFIX_LENGTH)[:PREFIX_LENGTH])
+
+def delta_encode(doc_ids):
+    """Sorted ids -> first id followed by the gaps between neighbours (small numbers, compact JSON)."""
+    encoded = []
+    previous = 0
+    for doc_id in doc_ids:
+        encoded.append(doc_id - previous)
+        previous = doc_id
+    return encoded
+
+class SearchIndexBuilder:
+    """
+    Builds a client-side inverted index over title/company/location/category
+    for the static site. Doc ids are the jobs' row ids, so they stay stable
+    between builds and old document shards don't change.
+
+    Output (all under search/):
+      meta.json          index parameters
+      t_<prefix>.json    {term: delta-encoded postings} for terms starting with <prefix>
+      d_<n>.json         {doc id: [title, company, location, category, experience, hash, date]}
+                         for doc ids n * DOCS_PER_SHARD ... (n + 1) * DOCS_PER_SHARD - 1
+
+    The search page only downloads meta.json, the term shards of the query's
+    tokens and the document shards of the hits it shows.
+    """
+
+    def __init__(self):
+        self.postings = defaultdict(set)
+        self.doc_shards = defaultdict(dict)
+        self.doc_count = 0
+
+    def add(self, job: Job):
+        doc_id = job.id
+        text = " ".join([job.title or "", job.company or "", job.location or "", job.role_category or ""])
+        for token in set(tokenize(text)):
+            self.postings[token].add(doc_id)
+
+        self.doc_shards[doc_id // DOCS_PER_SHARD][str(doc_id)] = [
+            job.title, job.company, job.location, job.role_category,
+            job.experience_level, job.job_hash, str(job.fetched_at)[:10]
+        ]
+        self.doc_count += 1
+
+    def files(self):
+        """Yields (relative path, JSON content) for every index file."""
+        term_shards = defaultdict(dict)
+        for token in sorted(self.postings):
+            term_shards[shard_name(token)][token] = delta_encode(sorted(self.postings[token]))
+
+        yield f"{INDEX_DIR}/meta.json", self._dump({
+            "version": 1,
+            "docs": self.doc_count,
+            "prefix_length": PREFIX_LENGTH,
+            "docs_per_shard": DOCS_PER_SHARD,
+            "shards": sorted(term_shards),
+        })
+        for name, terms in term_shards.items():
+            yield f"{INDEX_DIR}/t_{name}.json", self._dump(terms)
+        for number, docs in self.doc_shards.items():
+            yield f"{INDEX_DIR}/d_{number}.json", self._dump(docs)
+
+    @staticmethod
+    def _dump(data) -> str:
+        return json.dumps(data, separators=(",", ":"), sort_keys=True, ensure_ascii=False)
+
+# Vanilla JS for search.html. Mirrors tokenize() / shard_name() above.
+SEARCH_SCRIPT = """
+<script>
+(function () {
+    var input = document.getElementById("search-input");
+    var status = document.getElementById("search-status");
+    var results = document.getElementById("search-results");
+    var cache = {};
+    var meta = null;
+    var stopwords = {"a":1,"an":1,"and":1,"at":1,"for":1,"in":1,"of":1,"on":1,"or":1,"the":1,"to":1,"with":1};
+
+    function load(path) {
+        if (!cache[path]) {
+            cache[path] = fetch("search/" + path).then(function (r) { return r.ok ? r.json() : {}; });
+        }
+        return cache[path];
+    }
+
+    function tokenize(text) {
+        return (text.toLowerCase().match(/[a-z0-9+#]+/g) || []).filter(function (t) { return !stopwords[t]; });
+    }
+
+    function shardName(token) {
+        var padded = token;
+        while (padded.length < meta.prefix_length) { padded += "_"; }
+        return padded.slice(0, meta.prefix_length).replace(/[^a-z0-9]/g, "_");
+    }
+
+    function decode(deltas) {
+        var ids = [], current = 0;
+        for (var i = 0; i < deltas.length; i++) { current += deltas[i]; ids.push(current); }
+        return ids;
+    }
+
+    function lookup(token, prefix) {
+        // The last word of the query matches as a prefix while typing
+        return load("t_" + shardName(token) + ".json").then(function (terms) {
+            var ids = {};
+            Object.keys(terms).forEach(function (term) {
+                if (term === token || (prefix && term.indexOf(token) === 0)) {
+                    decode(terms[term]).forEach(function (id) { ids[id] = true; });
+                }
+            });
+            return ids;
+        });
+    }
+
+    function escapeHtml(text) {
+        return String(text).replace(/[&<>"']/g, function (c) {
+            return {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;"}[c];
+        });
+    }
+
+    function render(query, ids) {
+        var top = ids.slice(0, 50);
+        var shards = {};
+        top.forEach(function (id) { shards[Math.floor(id / meta.docs_per_shard)] = true; });
+        return Promise.all(Object.keys(shards).map(function (n) { return load("d_" + n + ".json"); })).then(function (loaded) {
+            if (input.value !== query) { return; }
+            var docs = {};
+            loaded.forEach(function (shard) { for (var id in shard) { docs[id] = shard[id]; } });
+            status.textContent = ids.length + " jobs found" + (ids.length > top.length ? ", showing the newest " + top.length : "");
+            results.innerHTML = top.map(function (id) {
+                var d = docs[id];
+                if (!d) { return ""; }
+                return '<div class="card"><div class="card-meta"><span>' + escapeHtml(d[6]) + '</span>' +
+                    '<span class="tag">' + escapeHtml(d[3]) + '</span><span class="tag">' + escapeHtml(d[4]) + '</span></div>' +
+                    '<h2><a href="job_' + d[5] + '.html" style="text-decoration: none; color: inherit;">' + escapeHtml(d[0]) + '</a></h2>' +
+                    '<p><strong>' + escapeHtml(d[1]) + '</strong> &bull; ' + escapeHtml(d[2]) + '</p>' +
+                    '<a href="job_' + d[5] + '.html" class="read-more">View Details</a></div>';
+            }).join("");
+        });
+    }
+
+    function search() {
+        var query = input.value;
+        var tokens = tokenize(query);
+        if (!tokens.length) { status.textContent = ""; results.innerHTML = ""; return; }
+        var typing = /[a-z0-9+#]$/i.test(query);
+        Promise.all(tokens.map(function (token, i) {
+            return lookup(token, typing && i === tokens.length - 1 && token.length >= meta.prefix_length);
+        })).then(function (sets) {
+            if (input.value !== query) { return; }
+            sets.sort(function (a, b) { return Object.keys(a).length - Object.keys(b).length; });
+            var ids = Object.keys(sets[0]).filter(function (id) {
+                return sets.every(function (set) { return set[id]; });
+            }).map(Number).sort(function (a, b) { return b - a; });
+            return render(query, ids);
+        });
+    }
+
+    var timer = null;
+    load("meta.json").then(function (m) {
+        meta = m;
+        input.disabled = false;
+        input.addEventListener("input", function () { clearTimeout(timer); timer = setTimeout(search, 150); });
+        var initial = new URLSearchParams(window.location.search).get("q");
+        if (initial) { input.value = initial; search(); }
+    });
+})();
+</script>
+"""
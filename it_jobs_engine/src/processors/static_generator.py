@@ -1,54 +1,57 @@
 import os
+import gzip
+import json
 import shutil
-from jinja2 import Environment, FileSystemLoader, Template
+import re
+import math
+import hashlib
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED, ALL_COMPLETED
+from jinja2 import Environment, DictLoader, FileSystemBytecodeCache
 from src.utils.logger import logger
 from src.models import Job
 from src.processors.formatter import ContentFormatter
+from src.processors.filters import normalize_location
+from src.processors.search_index import SearchIndexBuilder, SEARCH_SCRIPT, INDEX_DIR
+from src.processors.api_export import ApiExportBuilder, API_DIR
 from src.db import DatabaseManager
+from config.settings import (
+    STATIC_INCREMENTAL_BUILD, STATIC_RENDER_WORKERS, STATIC_RENDER_CHUNK_SIZE, JINJA_CACHE_DIR,
+    STATIC_PAGE_SIZE, STATIC_NAV_TOP_LOCATIONS, SITE_URL
+)
 from datetime import datetime
 
-class StaticSiteGenerator:
-    def __init__(self, output_dir="docs"):
-        self.output_dir = output_dir
-        self.db = DatabaseManager()
-        
-    def build(self):
-        logger.info("Starting Static Site Build...")
-        
-        # 1. Clean/Create Output Dir
-        if os.path.exists(self.output_dir):
-            shutil.rmtree(self.output_dir)
-        os.makedirs(self.output_dir)
-        
-        # 2. Fetch Jobs
-        rows = self.db._get_connection().execute("SELECT * FROM jobs ORDER BY fetched_at DESC").fetchall()
-        jobs = []
-        for row in rows:
-            jobs.append(Job(
-                title=row[2],
-                company=row[3],
-                location=row[4],
-                experience_level=row[5],
-                role_category=row[6],
-                apply_url=row[7],
-                source_name=row[8],
-                fetched_at=row[9],
-                job_hash=row[1]
-            ))
-            
-        # 3. Generate Index Page
-        self._generate_index(jobs)
-        
-        # 4. Generate Job Detail Pages
-        for job in jobs:
-            self._generate_job_page(job)
-            
-        # 5. Copy Assets (if any) - None for now as CSS is inline
-        
-        logger.info(f"Static Site Build Complete. Generated {len(jobs)} pages in '{self.output_dir}/'")
+try:
+    import brotli  # Optional: .br copies are only written when it's installed
+except ImportError:
+    brotli = None
+
+# Bump whenever the page markup built in this file changes, so the next
+# incremental build re-renders every page instead of trusting the manifest.
+TEMPLATE_VERSION = 4
+MANIFEST_NAME = ".build-manifest.json"
 
-    def _get_layout(self):
-        return """
+# Text outputs get precompressed siblings (page.html.gz / page.html.br) for servers and CDNs that serve them
+COMPRESSIBLE_EXTENSIONS = (".html", ".json", ".xml")
+SITEMAP_MAX_URLS = 50000  # Per sitemap file, as the sitemaps.org protocol allows
+# Render workers start from a clean interpreter: fork would copy the scheduler's open SQLite
+# connections, held locks and thread-pool state into every worker. forkserver isn't on Windows.
+RENDER_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+# (archive file prefix, jobs column, label) for every facet that gets archive pages
+FACETS = [
+    ("category", "role_category", "Category"),
+    ("experience", "experience_level", "Experience"),
+    ("location", "location", "Location"),
+    ("source", "source_name", "Source"),
+]
+
+def slugify(value: str) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "-", str(value).lower()).strip("-")
+    return slug or "unknown"
+
+LAYOUT = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -74,6 +77,10 @@ class StaticSiteGenerator:
         .filters { margin-bottom: 20px; display: flex; gap: 10px; flex-wrap: wrap; }
         .filter-btn { padding: 5px 10px; background: #e5e7eb; color: #374151; text-decoration: none; border-radius: 5px; font-size: 0.85rem; }
         .filter-btn:hover { background: #d1d5db; }
+        .search-form { display: flex; gap: 10px; margin-top: 15px; }
+        .search-form input { flex-grow: 1; padding: 10px; border: 1px solid #d1d5db; border-radius: 6px; font-size: 1rem; }
+        .search-form button { border: none; cursor: pointer; }
+        .pagination { display: flex; justify-content: space-between; align-items: center; margin: 30px 0; color: var(--text-muted); }
     </style>
     <!-- GLOBAL ADSENSE CODE HERE -->
     <!-- <script async src="https://pagead2.googlesyndication.com/pagead/js/adsbygoogle.js?client=ca-pub-XXXXXXXXXXXXXXXX" crossorigin="anonymous"></script> -->
@@ -90,13 +97,503 @@ class StaticSiteGenerator:
 </html>
 """
 
-    def _generate_index(self, jobs):
-        # In a static site, true filtering (search) usually requires client-side JS or generating separate pages per category.
-        # For MVP, we generate one main index with all jobs (Client-side JS could act filtering).
+_environment = None
+
+def get_environment() -> Environment:
+    """
+    The Jinja environment, created once per process. Templates are parsed and
+    compiled on first use and then served from the environment's cache; the
+    bytecode cache on disk lets fresh processes (pool workers, the next
+    cycle) skip compilation too.
+    """
+    global _environment
+    if _environment is None:
+        JINJA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _environment = Environment(
+            loader=DictLoader({"layout.html": LAYOUT}),
+            bytecode_cache=FileSystemBytecodeCache(str(JINJA_CACHE_DIR)),
+        )
+    return _environment
+
+def render_page(title: str, content: str) -> str:
+    return get_environment().get_template("layout.html").render(title=title, content=content)
+
+def write_if_changed(path: str, content: str) -> bool:
+    """
+    Writes content to path unless the file already holds exactly these bytes.
+    Writes go to a temp file that is renamed over the target, so readers never
+    see a half-written page. Returns True if the file was (re)written.
+    """
+    data = content.encode("utf-8")
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+
+    _write_atomic(path, data)
+    return True
+
+def _write_atomic(path: str, data: bytes):
+    # Never write into an existing file in place: the staging dir shares inodes
+    # (hard links) with the live site, so replace the directory entry instead.
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def write_output(path: str, content: str) -> bool:
+    """write_if_changed, plus up-to-date .gz (and .br) copies for text files."""
+    changed = write_if_changed(path, content)
+    if path.endswith(COMPRESSIBLE_EXTENSIONS):
+        data = None
+        for extension, compress in _compressors():
+            if changed or not os.path.exists(path + extension):
+                data = data if data is not None else content.encode("utf-8")
+                _write_atomic(path + extension, compress(data))
+    return changed
+
+def _compressors():
+    # mtime=0 keeps .gz output deterministic, so unchanged pages stay byte-identical
+    yield ".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0)
+    if brotli is not None:
+        yield ".br", lambda data: brotli.compress(data)
+
+def _remove_output(path: str) -> bool:
+    removed = False
+    for target in (path, path + ".gz", path + ".br"):
+        try:
+            os.remove(target)
+            removed = True
+        except FileNotFoundError:
+            pass
+    return removed
+
+def _render_job_chunk(output_dir: str, jobs) -> Counter:
+    """Process pool task: renders and writes one chunk of job pages."""
+    stats = Counter()
+    for job in jobs:
+        path = os.path.join(output_dir, f"job_{job.job_hash}.html")
+        stats["written" if write_output(path, render_job_page(job)) else "unchanged"] += 1
+    return stats
+
+def recover_interrupted_swap(output_dir: str = "docs"):
+    """Puts the last complete site back if a build crashed between the two renames of its swap (see _swap_in)."""
+    output_dir = os.path.normpath(output_dir)
+    old_dir = f"{output_dir}.old"
+    if not os.path.exists(output_dir) and os.path.exists(old_dir):
+        logger.warning("Previous build was interrupted mid-swap. Restoring the last complete site.")
+        os.rename(old_dir, output_dir)
+
+class JobPageRenderer:
+    """
+    Renders chunks of job pages on a process pool so a full rebuild uses every
+    core. The pool is only started once there is more than one chunk of work;
+    a handful of changed pages is cheaper to render in-process.
+    """
+
+    def __init__(self, output_dir: str, workers: int = STATIC_RENDER_WORKERS):
+        self.output_dir = output_dir
+        self.workers = workers
+        self.stats = Counter()
+        self._executor = None
+        self._futures = set()
+
+    def submit(self, jobs, last: bool = False):
+        if self._executor is None:
+            if last or self.workers <= 1:
+                self.stats.update(_render_job_chunk(self.output_dir, jobs))
+                return
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context(RENDER_START_METHOD)
+            )
+
+        # Keep a bounded number of chunks in flight so memory stays flat
+        while len(self._futures) >= self.workers * 2:
+            self._collect(FIRST_COMPLETED)
+        self._futures.add(self._executor.submit(_render_job_chunk, self.output_dir, list(jobs)))
+
+    def _collect(self, return_when):
+        done, self._futures = wait(self._futures, return_when=return_when)
+        for future in done:
+            self.stats.update(future.result())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if self._futures and exc_type is None:
+                self._collect(ALL_COMPLETED)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=exc_type is not None)
+
+class StaticSiteGenerator:
+    def __init__(self, output_dir="docs", db=None):
+        self.output_dir = output_dir
+        # Reuse the caller's manager (and its connection) when there is one
+        self.db = db or DatabaseManager()
+        self._template_key = hashlib.sha1(f"{TEMPLATE_VERSION}{LAYOUT}".encode("utf-8")).hexdigest()
+        
+    def build(self, incremental=STATIC_INCREMENTAL_BUILD):
+        """
+        The site is built in a staging directory next to the output dir and
+        swapped in at the end, so readers and deploys never see a half-built
+        (or, after a crash, empty) site.
+
+        Incremental builds keep a manifest of every output file and the
+        fingerprint of the inputs it was rendered from. Pages whose inputs
+        haven't changed are left alone, pages of jobs no longer in the DB are
+        deleted, and nothing is rewritten if its bytes come out the same.
+        """
+        logger.info("Starting Static Site Build...")
+        self._recover_interrupted_swap()
+        
+        # 1. Load the previous manifest. Without one we can't tell which files
+        #    are ours, so start from an empty staging dir. With one, staging
+        #    starts as the site from the build before (kept in <output>.old)
+        #    brought level with the live site, or failing that as a hard-linked
+        #    copy of the live site (no data is copied either way).
+        previous = self._load_manifest() if incremental else None
+        self._build_dir = self._staging_dir
+        if os.path.exists(self._build_dir):
+            shutil.rmtree(self._build_dir)
+        if previous is None:
+            previous = {}
+            os.makedirs(self._build_dir)
+        elif not self._reuse_old_tree(previous):
+            shutil.copytree(self.output_dir, self._build_dir, copy_function=os.link)
+        
+        self._previous = previous
+        self._manifest = {}
+        self._stats = Counter()
+        self._sitemap = []
+        
+        # 2. One pass over the job stream renders the job pages and fills every
+        #    listing (home page + facet archives), writing a listing page as soon
+        #    as it has all its jobs. Page sizes come from grouped counts.
+        self._load_facet_counts()
+        self._listings = {}
+        search_index = SearchIndexBuilder()
+        api_export = ApiExportBuilder()
+        chunk = []
+        with JobPageRenderer(self._build_dir) as renderer:
+            for job in self.db.iter_jobs():
+                self._sitemap.append((f"job_{job.job_hash}.html", str(job.fetched_at)[:10]))
+                if self._needs_render(f"job_{job.job_hash}.html", self._fingerprint("job", self._job_key(job))):
+                    chunk.append(job)
+                    if len(chunk) >= STATIC_RENDER_CHUNK_SIZE:
+                        renderer.submit(chunk)
+                        chunk = []
+                for listing in self._listings_for(job):
+                    self._add_to_listing(listing, job)
+                search_index.add(job)
+                api_export.add(job)
+            if chunk:
+                renderer.submit(chunk, last=True)
+        self._stats.update(renderer.stats)
+        
+        # 3. Flush the oldest page of every listing. The home page is written
+        #    even when there are no jobs at all.
+        self._listing_state(("all", None))
+        for listing, state in self._listings.items():
+            if state["jobs"] or state["page"] == 1:
+                self._emit_listing_page(listing, state["page"], state["total_pages"], state["jobs"])
+                
+        # 4. Client-side search: sharded index files plus the page that queries them
+        os.makedirs(os.path.join(self._build_dir, INDEX_DIR), exist_ok=True)
+        for path, data in search_index.files():
+            self._emit_data(path, data)
+        self._emit("search.html", self._fingerprint("search"), self._render_search_page)
+        
+        # 4b. JSON API export (id-ranged pages that stop changing once full)
+        os.makedirs(os.path.join(self._build_dir, API_DIR, "jobs"), exist_ok=True)
+        for path, data in api_export.files():
+            self._emit_data(path, data)
+        
+        # 5. Sitemap(s) for crawlers
+        for path, data in self._sitemap_files():
+            self._emit_data(path, data)
+            
+        # 6. Remove pages (jobs, archives, index shards) that are gone
+        for path in previous.keys() - self._manifest.keys():
+            if _remove_output(os.path.join(self._build_dir, path)):
+                self._stats["removed"] += 1
+                
+        # 7. Copy Assets (if any) - None for now as CSS is inline
         
-        job_html_list = ""
-        for job in jobs[:50]: # Limit to 50 recent on homepage to keep build fast
-            job_html_list += f"""
+        self._save_manifest()
+        self._swap_in()
+        logger.info(
+            f"Static Site Build Complete in '{self.output_dir}/': {len(self._manifest)} pages, "
+            f"{self._stats['written']} written, {self._stats['unchanged']} unchanged, "
+            f"{self._stats['skipped']} skipped, {self._stats['removed']} removed"
+        )
+
+    def _needs_render(self, path: str, fingerprint: str) -> bool:
+        """Records path in the new manifest; True if its fingerprint changed (or the file went missing)."""
+        self._manifest[path] = fingerprint
+        if self._previous.get(path) == fingerprint and os.path.exists(os.path.join(self._build_dir, path)):
+            self._stats["skipped"] += 1
+            return False
+        return True
+
+    def _emit(self, path: str, fingerprint: str, render):
+        """Renders and writes path in-process, if it needs it."""
+        if not self._needs_render(path, fingerprint):
+            return
+        if write_output(os.path.join(self._build_dir, path), render()):
+            self._stats["written"] += 1
+        else:
+            self._stats["unchanged"] += 1
+
+    def _emit_data(self, path: str, data: str):
+        """Emits a generated data file, fingerprinted by its own content."""
+        self._emit(path, self._fingerprint("data", hashlib.sha1(data.encode("utf-8")).hexdigest()), lambda: data)
+
+    @property
+    def _staging_dir(self) -> str:
+        return f"{os.path.normpath(self.output_dir)}.staging"
+
+    @property
+    def _old_dir(self) -> str:
+        return f"{os.path.normpath(self.output_dir)}.old"
+
+    def _swap_in(self):
+        """
+        Replaces the live output dir with the finished staging dir: two renames
+        on the same filesystem, so readers never see a partially written site.
+        Between the renames there is briefly no output dir at all; a crash in
+        that window leaves the old site in <output>.old, which
+        recover_interrupted_swap moves back on the next startup or build.
+        The replaced site stays in <output>.old for the next build to reuse.
+        """
+        if os.path.exists(self._old_dir):
+            shutil.rmtree(self._old_dir)
+        if os.path.exists(self.output_dir):
+            os.rename(self.output_dir, self._old_dir)
+        os.rename(self._build_dir, self.output_dir)
+
+    def _reuse_old_tree(self, live_manifest: dict) -> bool:
+        """
+        Turns <output>.old into the staging dir and syncs it with the live
+        site: only paths whose fingerprint differs between the two manifests
+        are re-linked from the live site or removed, so a build that changes
+        little costs little however big the site is (copying the live tree
+        would hard-link, and later delete, every file). False if there's no
+        usable old tree; the caller then copies the live site instead.
+        """
+        old_manifest = self._read_manifest(self._old_dir)
+        if old_manifest is None:
+            return False
+        os.rename(self._old_dir, self._build_dir)
+        try:
+            for path in old_manifest.keys() - live_manifest.keys():
+                _remove_output(os.path.join(self._build_dir, path))
+            for path, fingerprint in live_manifest.items():
+                if old_manifest.get(path) != fingerprint:
+                    self._link_from_live(path)
+            self._link_from_live(MANIFEST_NAME)
+            self._sync_unmanaged(live_manifest)
+        except OSError as e:
+            logger.warning(f"Could not reuse the previous site tree, copying the live site instead: {e}")
+            shutil.rmtree(self._build_dir, ignore_errors=True)
+            return False
+        return True
+
+    def _link_from_live(self, path: str):
+        """Makes the staging copy of path (and its .gz/.br siblings) the live file, by hard link."""
+        for target in (path, path + ".gz", path + ".br"):
+            source = os.path.join(self.output_dir, target)
+            destination = os.path.join(self._build_dir, target)
+            if os.path.lexists(destination):
+                os.remove(destination)
+            if os.path.exists(source):
+                os.makedirs(os.path.dirname(destination), exist_ok=True)
+                os.link(source, destination)
+
+    def _sync_unmanaged(self, live_manifest: dict):
+        # Files the build doesn't write itself (CNAME, .nojekyll, ...) are taken from the live site as they are
+        managed = {path.split("/")[0] for path in live_manifest} | {MANIFEST_NAME}
+        for entry in os.scandir(self.output_dir):
+            name = entry.name
+            for suffix in (".gz", ".br"):
+                if name.endswith(suffix) and name[:-len(suffix)] in managed:
+                    name = name[:-len(suffix)]
+            if name in managed:
+                continue
+            destination = os.path.join(self._build_dir, entry.name)
+            if os.path.lexists(destination) and os.path.samefile(entry.path, destination):
+                continue
+            if os.path.isdir(destination) and not os.path.islink(destination):
+                shutil.rmtree(destination)
+            elif os.path.lexists(destination):
+                os.remove(destination)
+            if entry.is_dir():
+                shutil.copytree(entry.path, destination, copy_function=os.link)
+            else:
+                os.link(entry.path, destination)
+
+    def _recover_interrupted_swap(self):
+        recover_interrupted_swap(self.output_dir)
+
+    def _sitemap_files(self):
+        """
+        Yields (path, xml) for the sitemap. Up to SITEMAP_MAX_URLS it is a single
+        sitemap.xml, beyond that sitemap.xml becomes an index of sitemap_N.xml files.
+        """
+        base_url = SITE_URL.rstrip("/")
+        chunks = [self._sitemap[i:i + SITEMAP_MAX_URLS] for i in range(0, len(self._sitemap), SITEMAP_MAX_URLS)] or [[]]
+
+        def urlset(entries):
+            urls = "".join(
+                f"<url><loc>{base_url}/{path}</loc><lastmod>{lastmod}</lastmod></url>\n" for path, lastmod in entries
+            )
+            return (
+                '<?xml version="1.0" encoding="UTF-8"?>\n'
+                '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+                f"{urls}</urlset>\n"
+            )
+
+        if len(chunks) == 1:
+            yield "sitemap.xml", urlset(chunks[0])
+            return
+
+        sitemaps = ""
+        for number, entries in enumerate(chunks, start=1):
+            yield f"sitemap_{number}.xml", urlset(entries)
+            lastmod = max(lastmod for _, lastmod in entries)
+            sitemaps += f"<sitemap><loc>{base_url}/sitemap_{number}.xml</loc><lastmod>{lastmod}</lastmod></sitemap>\n"
+        yield "sitemap.xml", (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+            f"{sitemaps}</sitemapindex>\n"
+        )
+
+    def _fingerprint(self, *parts) -> str:
+        return hashlib.sha1(repr((self._template_key,) + parts).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _job_key(job: Job) -> tuple:
+        """Every job field that ends up on a page."""
+        return (
+            job.job_hash, job.title, job.company, job.location, job.experience_level,
+            job.role_category, job.apply_url, job.source_name, str(job.fetched_at)
+        )
+
+    def _load_manifest(self):
+        return self._read_manifest(self.output_dir)
+
+    @staticmethod
+    def _read_manifest(site_dir: str):
+        try:
+            with open(os.path.join(site_dir, MANIFEST_NAME), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save_manifest(self):
+        write_if_changed(os.path.join(self._build_dir, MANIFEST_NAME), json.dumps(self._manifest, sort_keys=True))
+
+    @staticmethod
+    def _facet_value(facet: str, value) -> str:
+        if facet == "location":
+            return normalize_location(value)
+        return value or "Unknown"
+
+    def _load_facet_counts(self):
+        """
+        Jobs per archive page, from one grouped query per facet. Archives are
+        keyed by slug, so values differing only in case/punctuation share a page
+        (named after the most common spelling).
+        """
+        self._total_jobs = self.db.count_jobs()
+        self._facet_counts = {}
+        self._facet_names = {}
+        for facet, column, _ in FACETS:
+            counts = Counter()
+            names = {}
+            for value, count in sorted(self.db.count_jobs_by(column).items(), key=lambda item: -item[1]):
+                value = self._facet_value(facet, value)
+                counts[slugify(value)] += count
+                names.setdefault(slugify(value), value)
+            self._facet_counts[facet] = counts
+            self._facet_names[facet] = names
+
+    def _listings_for(self, job: Job):
+        """The home page listing plus one archive per facet, as (facet, slug) keys."""
+        yield ("all", None)
+        for facet, column, _ in FACETS:
+            yield (facet, slugify(self._facet_value(facet, getattr(job, column))))
+
+    def _listing_state(self, listing) -> dict:
+        """
+        Pages are numbered from the oldest job, so a new job only changes the
+        newest page(s) and every older page keeps its number and bytes. The
+        stream is newest first: the first page filled is the newest one, which
+        holds whatever is left over after the full pages.
+        """
+        state = self._listings.get(listing)
+        if state is None:
+            facet, value = listing
+            total = self._total_jobs if facet == "all" else self._facet_counts[facet].get(value, 0)
+            total_pages = max(1, math.ceil(total / STATIC_PAGE_SIZE))
+            state = self._listings[listing] = {
+                "page": total_pages,
+                "total_pages": total_pages,
+                "size": total - (total_pages - 1) * STATIC_PAGE_SIZE,
+                "jobs": [],
+            }
+        return state
+
+    def _add_to_listing(self, listing, job: Job):
+        state = self._listing_state(listing)
+        state["jobs"].append(job)
+        # Page 1 takes whatever is left, jobs saved after the counts were taken included
+        if state["page"] > 1 and len(state["jobs"]) >= state["size"]:
+            self._emit_listing_page(listing, state["page"], state["total_pages"], state["jobs"])
+            state["page"] -= 1
+            state["size"] = STATIC_PAGE_SIZE
+            state["jobs"] = []
+
+    @staticmethod
+    def listing_path(listing, page: int = None) -> str:
+        """Numbered page of a listing, or (without a page) its entry point, which shows the newest page."""
+        facet, value = listing
+        base = "index" if facet == "all" else f"{facet}_{value}"
+        if page is None:
+            return f"{base}.html"
+        if facet == "all":
+            return f"page_{page}.html"
+        return f"{base}_page_{page}.html"
+
+    def _emit_listing_page(self, listing, page: int, total_pages: int, jobs):
+        facet, value = listing
+        newest = page == total_pages
+        # Only the home page shows the facet links (with counts)
+        show_nav = listing == ("all", None) and newest
+        nav_key = sorted((f, sorted(c.items())) for f, c in self._facet_counts.items()) if show_nav else None
+        name = self._facet_names[facet].get(value, value) if facet != "all" else None
+
+        # The newest page is also written as the listing's entry point (index.html, <facet>_<value>.html).
+        # A single-page listing only gets the entry point.
+        paths = [self.listing_path(listing, page)] if total_pages > 1 else []
+        if newest:
+            paths.append(self.listing_path(listing))
+        for path in paths:
+            # Jobs on a page are newest first, so the first job dates it
+            self._sitemap.append((path, str(jobs[0].fetched_at)[:10] if jobs else datetime.now().strftime("%Y-%m-%d")))
+            # Older pages don't show the page count, so they stay byte-identical as the listing grows
+            self._emit(
+                path,
+                self._fingerprint("listing", path, name, page, newest, nav_key, *[self._job_key(job) for job in jobs]),
+                lambda: self._render_listing(listing, page, total_pages, jobs, show_nav),
+            )
+
+    def _render_card(self, job) -> str:
+        return f"""
             <div class="card">
                 <div class="card-meta">
                     <span>{str(job.fetched_at)[:10]}</span>
@@ -108,62 +605,124 @@ class StaticSiteGenerator:
                 <a href="job_{job.job_hash}.html" class="read-more">View Details</a>
             </div>
             """
-            
-        content = f"""
+
+    def _render_facet_nav(self) -> str:
+        groups = ""
+        for facet, _, label in FACETS:
+            counts = self._facet_counts[facet].most_common()
+            if facet == "location":
+                counts = counts[:STATIC_NAV_TOP_LOCATIONS]
+            links = "".join(
+                f'<a href="{self.listing_path((facet, slug))}" class="filter-btn">{self._facet_names[facet][slug]} ({count})</a>'
+                for slug, count in counts
+            )
+            groups += f"""
+            <div class="filters">
+                <span>{label}:</span>
+                {links}
+            </div>
+            """
+        return groups
+
+    def _render_pagination(self, listing, page: int, total_pages: int) -> str:
+        if total_pages <= 1:
+            return ""
+        newer = f'<a href="{self.listing_path(listing, page + 1)}" class="btn">&larr; Newer</a>' if page < total_pages else "<span></span>"
+        older = f'<a href="{self.listing_path(listing, page - 1)}" class="btn">Older &rarr;</a>' if page > 1 else "<span></span>"
+        return f"""
+        <div class="pagination">
+            {newer}
+            <span>Page {page}</span>
+            {older}
+        </div>
+        """
+
+    def _render_listing(self, listing, page: int, total_pages: int, jobs, show_nav: bool) -> str:
+        facet, slug = listing
+        job_html_list = "".join(self._render_card(job) for job in jobs)
+        newest = page == total_pages
+
+        if facet == "all":
+            title = "IT Jobs Alert Engine - Latest Jobs" if newest else f"IT Jobs Alert Engine - Latest Jobs (Page {page})"
+            header = """
         <header>
             <h1>IT Jobs Alert Engine</h1>
             <p class="subtitle">Curated Tech Opportunities. Updated Hourly.</p>
+            <form action="search.html" method="get" class="search-form">
+                <input type="text" name="q" placeholder="Search jobs (e.g. python bengaluru)">
+                <button type="submit" class="btn">Search</button>
+            </form>
+        </header>
+            """
+        else:
+            label = next(label for f, _, label in FACETS if f == facet)
+            value = self._facet_names[facet].get(slug, slug)
+            title = f"{value} IT Jobs" + (f" (Page {page})" if not newest else "")
+            header = f"""
+        <a href="index.html" class="back-link">&larr; All Jobs</a>
+        <header>
+            <h1>{value} Jobs</h1>
+            <p class="subtitle">{label}: {value}. Updated Hourly.</p>
         </header>
+            """
+
+        content = f"""
+        {header}
         
         <!-- AD SLOT HEADER -->
         <div class="ad-slot">
             <p>Advertisement Space (Header)</p>
         </div>
         
-        <div class="filters">
-            <span>Quick Filters (Coming Soon in V2):</span>
-            <span class="filter-btn">Remote</span>
-            <span class="filter-btn">Bangalore</span>
-            <span class="filter-btn">Python</span>
-        </div>
+        {self._render_facet_nav() if show_nav else ""}
         
         <div class="job-list">
             {job_html_list}
         </div>
-        """
         
-        template = Template(self._get_layout())
-        html = template.render(title="IT Jobs Alert Engine - Latest Jobs", content=content)
+        {self._render_pagination(listing, page, total_pages)}
+        """
         
-        with open(f"{self.output_dir}/index.html", "w") as f:
-            f.write(html)
+        return render_page(title, content)
 
-    def _generate_job_page(self, job):
-        blog_data = ContentFormatter.format_blog(job)
-        
-        content = f"""
+    def _render_search_page(self) -> str:
+        content = """
         <a href="index.html" class="back-link">&larr; Back to Jobs</a>
-        
-        <!-- AD SLOT IN-ARTICLE -->
-        <div class="ad-slot">
-            <p>Advertisement Space (Top of Job)</p>
-        </div>
-        
-        <div class="card">
-            <h1>{blog_data['title']}</h1>
-            <div class="post-content">
-                {blog_data['content']}
+        <header>
+            <h1>Search Jobs</h1>
+            <p class="subtitle">Search by title, company, location or category.</p>
+            <div class="search-form">
+                <input type="text" id="search-input" placeholder="e.g. senior python bengaluru" autofocus disabled>
             </div>
+        </header>
+        <p id="search-status" class="subtitle"></p>
+        <div id="search-results" class="job-list"></div>
+        """ + SEARCH_SCRIPT
+
+        return render_page("Search IT Jobs", content)
+
+def render_job_page(job: Job) -> str:
+    blog_data = ContentFormatter.format_blog(job)
+    
+    content = f"""
+    <a href="index.html" class="back-link">&larr; Back to Jobs</a>
+    
+    <!-- AD SLOT IN-ARTICLE -->
+    <div class="ad-slot">
+        <p>Advertisement Space (Top of Job)</p>
+    </div>
+    
+    <div class="card">
+        <h1>{blog_data['title']}</h1>
+        <div class="post-content">
+            {blog_data['content']}
         </div>
-        
-        <!-- AD SLOT BOTTOM -->
-        <div class="ad-slot">
-            <p>Advertisement Space (Bottom)</p>
-        </div>
-        """
-        
-        template = Template(self._get_layout())
-        html = template.render(title=f"{job.title} at {job.company}", content=content)
-        
-        with open(f"{self.output_dir}/job_{job.job_hash}.html", "w") as f:
-            f.write(html)
+    </div>
+    
+    <!-- AD SLOT BOTTOM -->
+    <div class="ad-slot">
+        <p>Advertisement Space (Bottom)</p>
+    </div>
+    """
+    
+    return render_page(f"{job.title} at {job.company}", content)
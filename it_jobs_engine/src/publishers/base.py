@@ -0,0 +1,63 @@
+import requests
+from typing import List, Tuple
+from src.models import Job
+from src.utils.http import get_session
+
+class RateLimited(Exception):
+    """The API refused the post because we're sending too fast. Safe to retry after `retry_after` seconds."""
+
+    def __init__(self, channel: str, retry_after: float):
+        super().__init__(f"{channel} rate limited, retry after {retry_after:g}s")
+        self.channel = channel
+        self.retry_after = retry_after
+
+class BasePublisher:
+    # Per-channel limits used by the publish pipeline (see config/settings.py)
+    rate_per_minute = 60.0
+    burst = 1
+    concurrency = 1
+    # Channels that can pack many jobs into one post set this and implement format_digest / publish_digest
+    digest = False
+    digest_min_jobs = 1
+    digest_max_wait_minutes = 0.0
+    digest_batch = 1
+
+    def __init__(self, channel: str, api_url: str = None):
+        self.channel = channel
+        self.api_url = api_url
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled keep-alive session for this publisher's API host (retries only when safe for POST)."""
+        return get_session(self.api_url, idempotent=False)
+
+    @property
+    def enabled(self) -> bool:
+        """False when the channel isn't configured; its posts are recorded as skipped."""
+        return bool(self.api_url)
+
+    def publish_job(self, job: Job) -> bool:
+        """
+        Formats the job for this channel and posts it. Returns False if the
+        channel isn't configured, raises RateLimited on 429 and any other
+        exception if the post failed.
+        """
+        raise NotImplementedError
+
+    def format_digest(self, jobs: List[Job]) -> List[Tuple[str, List[Job]]]:
+        """Packs jobs into digest posts: (post, jobs it covers) pairs."""
+        raise NotImplementedError
+
+    def publish_digest(self, message: str) -> bool:
+        """Posts one digest built by format_digest. Same contract as publish_job."""
+        raise NotImplementedError
+
+    def _check_rate_limit(self, response: requests.Response, default_retry_after: float = 60.0):
+        if response.status_code != 429:
+            return
+        retry_after = response.headers.get("Retry-After")
+        try:
+            retry_after = float(retry_after)
+        except (TypeError, ValueError):
+            retry_after = default_retry_after
+        raise RateLimited(self.channel, retry_after)
@@ -1,14 +1,28 @@
 import requests
 import base64
-from config.settings import BLOG_API_URL, BLOG_USERNAME, BLOG_PASSWORD
+from config.settings import (
+    BLOG_API_URL, BLOG_USERNAME, BLOG_PASSWORD,
+    BLOG_RATE_PER_MINUTE, BLOG_BURST, BLOG_CONCURRENCY
+)
+from src.models import Job
+from src.processors.formatter import ContentFormatter
 from src.utils.logger import logger
+from src.publishers.base import BasePublisher
+
+class BlogPublisher(BasePublisher):
+    rate_per_minute = BLOG_RATE_PER_MINUTE
+    burst = BLOG_BURST
+    concurrency = BLOG_CONCURRENCY
 
-class BlogPublisher:
     def __init__(self):
-        self.api_url = BLOG_API_URL
+        super().__init__("blog", BLOG_API_URL)
         self.username = BLOG_USERNAME
         self.password = BLOG_PASSWORD
 
+    def publish_job(self, job: Job) -> bool:
+        blog_data = ContentFormatter.format_blog(job)
+        return self.publish(blog_data["title"], blog_data["content"], blog_data["tags"])
+
     def publish(self, title: str, content: str, tags: list = None) -> bool:
         if not self.api_url:
             logger.warning("Blog API URL missing. Skipping publish.")
@@ -32,7 +46,8 @@ class BlogPublisher:
         }
 
         try:
-            response = requests.post(self.api_url, json=payload, headers=headers, timeout=15)
+            response = self.session.post(self.api_url, json=payload, headers=headers, timeout=15)
+            self._check_rate_limit(response)
             response.raise_for_status()
             logger.info(f"Published to Blog: {title}")
             return True
@@ -40,4 +55,4 @@ class BlogPublisher:
             logger.error(f"Failed to publish to blog: {e}")
             if response := e.response:
                 logger.error(f"Response: {response.text}")
-            return False
+            raise  # The outbox records the error and retries later
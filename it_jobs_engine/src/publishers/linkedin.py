@@ -1,10 +1,28 @@
+from config.settings import (
+    LINKEDIN_PUBLISH_RATE_PER_MINUTE, LINKEDIN_PUBLISH_BURST, LINKEDIN_PUBLISH_CONCURRENCY
+)
+from src.models import Job
+from src.processors.formatter import ContentFormatter
 from src.utils.logger import logger
+from src.publishers.base import BasePublisher
+
+class LinkedInPublisher(BasePublisher):
+    rate_per_minute = LINKEDIN_PUBLISH_RATE_PER_MINUTE
+    burst = LINKEDIN_PUBLISH_BURST
+    concurrency = LINKEDIN_PUBLISH_CONCURRENCY
 
-class LinkedInPublisher:
     def __init__(self):
         # LinkedIn API is complex (requires refresh tokens, etc.)
         # For this MVP/Scope, we will just log or print.
-        pass
+        super().__init__("linkedin", "https://api.linkedin.com/v2/ugcPosts")
+
+    @property
+    def enabled(self) -> bool:
+        # Nothing is posted yet, so don't spend rate-limit budget on it or report it as published
+        return False
+
+    def publish_job(self, job: Job) -> bool:
+        return self.publish(ContentFormatter.format_linkedin(job))
 
     def publish(self, message: str) -> bool:
         # Placeholder for future implementation
@@ -0,0 +1,184 @@
+import random
+import threading
+import time
+import requests
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import List
+from config.settings import (
+    PUBLISH_RATE_LIMIT_RETRIES, PUBLISH_MAX_ATTEMPTS, PUBLISH_BACKOFF_BASE_SECONDS,
+    PUBLISH_BACKOFF_MAX_SECONDS, PUBLISH_CLAIM_BATCH, PUBLISH_LEASE_SECONDS
+)
+from src.db import DatabaseManager, OUTBOX_SUCCESS, OUTBOX_FAILED, OUTBOX_SKIPPED
+from src.models import Job
+from src.publishers.base import BasePublisher, RateLimited
+from src.utils.logger import logger
+from src.utils.rate_limit import TokenBucket
+
+RETRY = "RETRY"  # Attempt failed, the outbox row stays pending
+
+def backoff_delay(attempts: int) -> float:
+    """Seconds to wait after `attempts` failed tries: doubling from the base, capped, jittered between half and all of it."""
+    delay = min(PUBLISH_BACKOFF_MAX_SECONDS, PUBLISH_BACKOFF_BASE_SECONDS * 2 ** (attempts - 1))
+    return random.uniform(delay / 2, delay)
+
+def is_permanent(error: Exception) -> bool:
+    """
+    Failures that sending the same post again can't fix: the API rejected the
+    request itself (any 4xx but 408 and 429: bad payload, credentials,
+    permissions), or the post couldn't be built from the job at all.
+    """
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return 400 <= status < 500 and status not in (408, 429)
+    # requests raises some ValueError subclasses of its own (e.g. a bad response body), those stay retryable
+    return isinstance(error, (ValueError, TypeError, KeyError)) and not isinstance(error, requests.RequestException)
+
+class _Channel:
+    """One publisher with its own token bucket and worker threads, fed from the outbox."""
+
+    def __init__(self, publisher: BasePublisher, db: DatabaseManager):
+        self.publisher = publisher
+        self.name = publisher.channel
+        self.db = db
+        self.bucket = TokenBucket(publisher.rate_per_minute, publisher.burst)
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
+        self.workers = [
+            threading.Thread(target=self._work, name=f"publish-{self.name}-{i}", daemon=True)
+            for i in range(max(1, publisher.concurrency))
+        ]
+
+    def start(self):
+        for worker in self.workers:
+            worker.start()
+
+    def join(self):
+        for worker in self.workers:
+            worker.join()
+
+    def _work(self):
+        # Each worker claims its own batches until nothing is due for this channel
+        try:
+            while True:
+                batch_size = self.publisher.digest_batch if self.publisher.digest else PUBLISH_CLAIM_BATCH
+                claimed = self.db.claim_outbox(self.name, batch_size, PUBLISH_LEASE_SECONDS)
+                if not claimed:
+                    return
+                if not self.publisher.enabled:
+                    outcomes = [self._skip(job) for job, _ in claimed]
+                elif self.publisher.digest:
+                    if self._hold_digest(claimed):
+                        self.db.release_outbox(self.name, [job.job_hash for job, _ in claimed])
+                        return
+                    outcomes = self._publish_digest(claimed)
+                else:
+                    outcomes = [self._publish(job, attempts + 1) for job, attempts in claimed]
+                with self._stats_lock:
+                    self.stats.update(outcomes)
+        except Exception as e:
+            # Claimed rows are still leased, they come back after PUBLISH_LEASE_SECONDS
+            logger.error(f"Publish worker for {self.name} stopped: {e}")
+        finally:
+            self.db.close()
+
+    def _skip(self, job: Job) -> str:
+        # Still let the publisher log / preview the post, just don't count it against the limit
+        self.publisher.publish_job(job)
+        self.db.record_publish_attempt(job.job_hash, self.name, OUTBOX_SKIPPED)
+        return OUTBOX_SKIPPED
+
+    def _publish(self, job: Job, attempt: int) -> str:
+        return self._record(job, attempt, *self._send(lambda: self.publisher.publish_job(job)))
+
+    def _hold_digest(self, claimed) -> bool:
+        """Too few jobs for a digest, and none has waited long enough to go out anyway."""
+        if len(claimed) >= self.publisher.digest_min_jobs:
+            return False
+        oldest = min(_fetched_at(job) for job, _ in claimed)
+        return datetime.now() - oldest < timedelta(minutes=self.publisher.digest_max_wait_minutes)
+
+    def _publish_digest(self, claimed) -> list:
+        attempts = {job.job_hash: attempt for job, attempt in claimed}
+        outcomes = []
+        for message, jobs in self.publisher.format_digest([job for job, _ in claimed]):
+            # One post covers all its jobs: they succeed or retry together
+            result = self._send(lambda: self.publisher.publish_digest(message))
+            outcomes.extend(self._record(job, attempts[job.job_hash] + 1, *result) for job in jobs)
+        return outcomes
+
+    def _send(self, post):
+        """
+        Runs post() under the channel's rate limit. Returns (error, retry_after,
+        permanent); error is None on success, permanent means don't retry (see is_permanent).
+        """
+        error, retry_after = None, 0.0
+        for _ in range(PUBLISH_RATE_LIMIT_RETRIES + 1):
+            self.bucket.acquire()
+            try:
+                if post():
+                    return None, 0.0, False
+                return "Publisher is not configured", 0.0, False
+            except RateLimited as e:
+                # Everyone on this channel waits, not just this worker
+                logger.warning(f"{e}. Pausing {self.name} publishing.")
+                self.bucket.pause(e.retry_after)
+                error, retry_after = str(e), e.retry_after
+            except Exception as e:
+                return f"{type(e).__name__}: {e}", 0.0, is_permanent(e)
+        return error, retry_after, False
+
+    def _record(self, job: Job, attempt: int, error, retry_after: float, permanent: bool = False) -> str:
+        if error is None:
+            self.db.record_publish_attempt(job.job_hash, self.name, OUTBOX_SUCCESS)
+            return OUTBOX_SUCCESS
+
+        if permanent or attempt >= PUBLISH_MAX_ATTEMPTS:
+            reason = "rejected, not retrying" if permanent else f"giving up after {attempt} attempts"
+            logger.error(f"Publishing {job.job_hash} to {self.name} {reason}: {error}")
+            self.db.record_publish_attempt(job.job_hash, self.name, OUTBOX_FAILED, error=error)
+            return OUTBOX_FAILED
+
+        delay = max(retry_after, backoff_delay(attempt))
+        logger.warning(f"Publishing {job.job_hash} to {self.name} failed (attempt {attempt}), retrying in {delay:.0f}s: {error}")
+        self.db.record_publish_attempt(job.job_hash, self.name, None, error=error, retry_at=time.time() + delay)
+        return RETRY
+
+def _fetched_at(job: Job) -> datetime:
+    # Loaded from SQLite the timestamp is still its ISO text
+    if isinstance(job.fetched_at, datetime):
+        return job.fetched_at
+    try:
+        return datetime.fromisoformat(str(job.fetched_at))
+    except ValueError:
+        return datetime.min
+
+class PublishPipeline:
+    """
+    Publishes everything that is due in the outbox. Each channel runs on its
+    own threads, as fast as its token bucket allows; a 429 with retry_after
+    pauses only that channel, and a channel that keeps failing only delays
+    its own rows. Failed posts are retried with exponential backoff on later
+    runs until PUBLISH_MAX_ATTEMPTS, so an outage doesn't lose posts; posts
+    the API rejects outright (bad request, auth) fail at once.
+    """
+
+    def __init__(self, publishers: List[BasePublisher], db: DatabaseManager):
+        self.db = db
+        self._channels = [_Channel(publisher, db) for publisher in publishers]
+
+    def run(self) -> Counter:
+        """Enqueues unpublished jobs, publishes what is due and returns outcome counts."""
+        added = self.db.enqueue_pending_jobs(channel.name for channel in self._channels)
+        if added:
+            logger.info(f"Queued {added} new posts in the publish outbox.")
+
+        for channel in self._channels:
+            channel.start()
+        stats = Counter()
+        for channel in self._channels:
+            channel.join()
+            stats.update(channel.stats)
+            if channel.stats:
+                logger.info(f"Publishing to {channel.name}: {dict(channel.stats)}")
+        return stats
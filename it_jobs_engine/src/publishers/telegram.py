@@ -1,15 +1,43 @@
 import requests
-from config.settings import TELEGRAM_BOT_TOKEN, TELEGRAM_CHANNEL_ID
+from config.settings import (
+    TELEGRAM_BOT_TOKEN, TELEGRAM_CHANNEL_ID,
+    TELEGRAM_RATE_PER_MINUTE, TELEGRAM_BURST, TELEGRAM_CONCURRENCY,
+    TELEGRAM_DIGEST_ENABLED, TELEGRAM_DIGEST_MIN_JOBS, TELEGRAM_DIGEST_MAX_WAIT_MINUTES, TELEGRAM_DIGEST_BATCH
+)
+from src.models import Job
+from src.processors.formatter import ContentFormatter
 from src.utils.logger import logger
+from src.publishers.base import BasePublisher, RateLimited
+
+class TelegramPublisher(BasePublisher):
+    rate_per_minute = TELEGRAM_RATE_PER_MINUTE
+    burst = TELEGRAM_BURST
+    concurrency = TELEGRAM_CONCURRENCY
+    digest = TELEGRAM_DIGEST_ENABLED
+    digest_min_jobs = TELEGRAM_DIGEST_MIN_JOBS
+    digest_max_wait_minutes = TELEGRAM_DIGEST_MAX_WAIT_MINUTES
+    digest_batch = TELEGRAM_DIGEST_BATCH
 
-class TelegramPublisher:
     def __init__(self):
         self.token = TELEGRAM_BOT_TOKEN
         self.chat_id = TELEGRAM_CHANNEL_ID
-        self.api_url = f"https://api.telegram.org/bot{self.token}/sendMessage"
+        super().__init__("telegram", f"https://api.telegram.org/bot{self.token}/sendMessage")
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.token and self.chat_id)
+
+    def publish_job(self, job: Job) -> bool:
+        return self.publish(ContentFormatter.format_telegram(job))
+
+    def format_digest(self, jobs):
+        return ContentFormatter.format_telegram_digest(jobs)
+
+    def publish_digest(self, message: str) -> bool:
+        return self.publish(message)
 
     def publish(self, message: str) -> bool:
-        if not self.token or not self.chat_id:
+        if not self.enabled:
             logger.warning("Telegram credentials missing. Skipping publish.")
             print(f"[PREVIEW TELEGRAM MESSAGE]:\n{message}\n")
             return False
@@ -22,10 +50,22 @@ class TelegramPublisher:
         }
         
         try:
-            response = requests.post(self.api_url, json=payload, timeout=10)
+            response = self.session.post(self.api_url, json=payload, timeout=10)
+            self._check_rate_limit(response)
             response.raise_for_status()
             logger.info("Published to Telegram successfully.")
             return True
         except requests.RequestException as e:
             logger.error(f"Failed to publish to Telegram: {e}")
-            return False
+            raise  # The outbox records the error and retries later
+
+    def _check_rate_limit(self, response, default_retry_after: float = 60.0):
+        # Flood control: {"ok": false, "error_code": 429, "parameters": {"retry_after": 35}}
+        if response.status_code == 429:
+            try:
+                retry_after = response.json()["parameters"]["retry_after"]
+            except (ValueError, KeyError, TypeError):
+                pass
+            else:
+                raise RateLimited(self.channel, float(retry_after))
+        super()._check_rate_limit(response, default_retry_after)
@@ -0,0 +1,110 @@
+import random
+import threading
+import time
+import urllib.parse
+from contextlib import contextmanager
+from typing import Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from config.settings import (
+    HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_MAX_RETRIES,
+    HTTP_BACKOFF_FACTOR, HTTP_BACKOFF_MAX
+)
+
+# Safe to retry for GETs: the request either never reached the app or failed before doing anything
+IDEMPOTENT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+# For POSTs we only retry answers that guarantee the request was not processed.
+# 429 is left to the publish pipeline, which pauses the whole channel instead of one request.
+NON_IDEMPOTENT_RETRY_STATUSES = (503,)
+
+_deadlines = threading.local()
+
+@contextmanager
+def request_deadline(deadline: Optional[float]):
+    """
+    Requests made by this thread inside the block stop retrying at `deadline`
+    (a time.monotonic() value): backoff and Retry-After sleeps are cut short
+    to it, and no retry starts after it. None means no deadline.
+    """
+    previous = getattr(_deadlines, "deadline", None)
+    _deadlines.deadline = deadline
+    try:
+        yield
+    finally:
+        _deadlines.deadline = previous
+
+def _time_left() -> Optional[float]:
+    deadline = getattr(_deadlines, "deadline", None)
+    return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+class JitteredRetry(Retry):
+    """
+    Exponential backoff with random jitter, a cap on server-sent Retry-After,
+    and the calling thread's request_deadline.
+    """
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return 0
+        return self._cap(min(HTTP_BACKOFF_MAX, backoff + random.uniform(0, backoff)))
+
+    def parse_retry_after(self, retry_after: str) -> float:
+        return self._cap(min(HTTP_BACKOFF_MAX, super().parse_retry_after(retry_after)))
+
+    def is_exhausted(self) -> bool:
+        # Out of time counts as out of retries: urllib3 then returns the last response (or raises)
+        left = _time_left()
+        return super().is_exhausted() or (left is not None and left <= 0)
+
+    @staticmethod
+    def _cap(seconds: float) -> float:
+        left = _time_left()
+        return seconds if left is None else min(seconds, left)
+
+def _build_retry(idempotent: bool) -> Retry:
+    if idempotent:
+        return JitteredRetry(
+            total=HTTP_MAX_RETRIES,
+            backoff_factor=HTTP_BACKOFF_FACTOR,
+            status_forcelist=IDEMPOTENT_RETRY_STATUSES,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+    return JitteredRetry(
+        total=HTTP_MAX_RETRIES,
+        read=0,  # The server may have acted on it already, don't double-post
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=NON_IDEMPOTENT_RETRY_STATUSES,
+        allowed_methods=frozenset(["GET", "HEAD", "POST"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+_sessions = {}
+_lock = threading.Lock()
+
+def get_session(url: str, idempotent: bool = True) -> requests.Session:
+    """
+    Returns the shared keep-alive session for the host of `url`.
+    Sessions are created once per (host, retry policy) and reused for the
+    whole process, so repeated requests skip the TCP+TLS handshake.
+    Use idempotent=False for publishers that POST.
+    """
+    parts = urllib.parse.urlsplit(url)
+    key = (parts.scheme, parts.netloc, idempotent)
+
+    with _lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=HTTP_POOL_CONNECTIONS,
+                pool_maxsize=HTTP_POOL_MAXSIZE,
+                max_retries=_build_retry(idempotent),
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[key] = session
+    return session
@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+from config.settings import HTTP_CACHE_DIR, HTTP_CACHE_MAX_BYTES, HTTP_CACHE_TTL_SECONDS
+from src.utils.logger import logger
+
+class ResponseCache:
+    """
+    On-disk cache of response bodies plus their ETag / Last-Modified validators.
+    One JSON file per URL. A file's mtime is its last use, so eviction drops
+    the least recently used entries once the directory grows past max_bytes.
+    Entries older than ttl_seconds are discarded and fetched again in full.
+    """
+
+    def __init__(self, cache_dir=HTTP_CACHE_DIR, max_bytes=HTTP_CACHE_MAX_BYTES, ttl_seconds=HTTP_CACHE_TTL_SECONDS):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, url: str) -> Optional[dict]:
+        path = self._path(url)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("url") != url or time.time() - entry.get("stored_at", 0) > self.ttl_seconds:
+            self._remove(path)
+            return None
+
+        try:
+            # Bump mtime so eviction sees this entry as recently used
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    def conditional_headers(self, entry: Optional[dict]) -> dict:
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def put(self, url: str, response):
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified):
+            # Nothing to revalidate with, caching the body would be useless
+            return
+
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "stored_at": time.time(),
+            "body": response.text,
+        }
+        if self._write(url, entry):
+            self._evict()
+
+    def set_job_hashes(self, url: str, job_hashes):
+        """Remembers which jobs the cached page held, so a 304 can skip parsing it (see BaseFetcher.fetch_page)."""
+        entry = self.get(url)
+        if entry is not None:
+            entry["job_hashes"] = list(job_hashes)
+            self._write(url, entry)
+
+    def mark_fresh(self, url: str, entry: dict):
+        """Server answered 304: the entry is valid again for another TTL."""
+        entry["stored_at"] = time.time()
+        self._write(url, entry)
+
+    def _write(self, url: str, entry: dict) -> bool:
+        path = self._path(url)
+        # Write-then-rename so concurrent fetchers never read a half-written entry
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+            return True
+        except OSError as e:
+            logger.warning(f"Could not write HTTP cache entry for {url}: {e}")
+            self._remove(tmp_path)
+            return False
+
+    def _evict(self):
+        with self._lock:
+            entries = []
+            total = 0
+            for item in os.scandir(self.cache_dir):
+                if not item.name.endswith(".json"):
+                    continue
+                try:
+                    stat = item.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, item.path))
+                total += stat.st_size
+
+            if total <= self.max_bytes:
+                return
+
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                self._remove(path)
+                total -= size
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+def get_response_cache() -> ResponseCache:
+    """Process-wide cache shared by all fetchers."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache()
+    return _default_cache
@@ -0,0 +1,104 @@
+import hashlib
+import os
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from itertools import chain
+from typing import Iterable, Optional
+from src.utils.logger import logger
+
+SNAPSHOT_MAGIC = b"KHI2"
+SNAPSHOT_HEADER = struct.Struct("<4sQQQ")  # magic, high-water row id, key of that row's hash, count
+
+def hash_key(job_hash: str) -> int:
+    """64-bit key of a job hash: the first 16 hex digits of the MD5 (collisions ~1e-8 at a million jobs)."""
+    try:
+        return int(job_hash[:16], 16)
+    except (TypeError, ValueError):
+        return int.from_bytes(hashlib.md5(str(job_hash).encode("utf-8")).digest()[:8], "big")
+
+class KnownHashIndex:
+    """
+    Compact in-memory set of every stored job hash: a sorted array of 64-bit
+    keys (8 bytes per job, binary search) plus a small set of recent inserts
+    that is merged in from time to time. Persisted as a snapshot together with
+    the highest row id it covers and that row's hash key, so startup only reads
+    the rows added since (and can tell the snapshot belongs to this database).
+    """
+
+    def __init__(self, keys: Optional[array] = None, high_water_id: int = 0, high_water_key: int = 0):
+        self._sorted = keys if keys is not None else array("Q")
+        self._recent = set()
+        self.high_water_id = high_water_id
+        self.high_water_key = high_water_key
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sorted) + len(self._recent)
+
+    def __contains__(self, job_hash: str) -> bool:
+        with self._lock:
+            return self._contains_key(hash_key(job_hash))
+
+    def _contains_key(self, key: int) -> bool:
+        if key in self._recent:
+            return True
+        i = bisect_left(self._sorted, key)
+        return i < len(self._sorted) and self._sorted[i] == key
+
+    def update(self, job_hashes: Iterable[str], high_water_id: int = None, high_water_hash: str = None):
+        """Adds hashes; high_water_id/high_water_hash are the id and hash of the newest row they cover."""
+        with self._lock:
+            for key in map(hash_key, job_hashes):
+                if not self._contains_key(key):
+                    self._recent.add(key)
+            if high_water_id is not None and high_water_id >= self.high_water_id:
+                self.high_water_id = high_water_id
+                self.high_water_key = hash_key(high_water_hash) if high_water_hash else 0
+            # Merging is O(n), so let the recent set grow to a fraction of the array first
+            if len(self._recent) > max(1024, len(self._sorted) // 8):
+                self._merge()
+
+    def _merge(self):
+        if self._recent:
+            # Two sorted runs, which sorted() merges in linear time
+            self._sorted = array("Q", sorted(chain(self._sorted, sorted(self._recent))))
+            self._recent.clear()
+
+    def save(self, path: str):
+        with self._lock:
+            self._merge()
+            data = self._sorted if sys.byteorder == "little" else self._byteswapped(self._sorted)
+            header = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, self.high_water_id, self.high_water_key, len(self._sorted))
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(header)
+                data.tofile(f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write known-hash snapshot {path}: {e}")
+
+    @classmethod
+    def load(cls, path: str) -> Optional["KnownHashIndex"]:
+        """The snapshot at path, or None if there is none (or it's unreadable)."""
+        try:
+            with open(path, "rb") as f:
+                magic, high_water_id, high_water_key, count = SNAPSHOT_HEADER.unpack(f.read(SNAPSHOT_HEADER.size))
+                if magic != SNAPSHOT_MAGIC:
+                    return None
+                keys = array("Q")
+                keys.fromfile(f, count)
+        except (OSError, EOFError, struct.error):
+            return None
+        if sys.byteorder != "little":
+            keys = cls._byteswapped(keys)
+        return cls(keys, high_water_id, high_water_key)
+
+    @staticmethod
+    def _byteswapped(keys: array) -> array:
+        swapped = array("Q", keys)
+        swapped.byteswap()
+        return swapped
@@ -0,0 +1,39 @@
+import threading
+import time
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate_per_minute` sustained, up to `burst`
+    back to back. acquire() blocks until the caller may send.
+
+    Callers reserve their slot under the lock and sleep outside it, so
+    concurrent workers are spaced out instead of all waking at once.
+    pause() stops the bucket entirely, e.g. for a server's retry_after.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int = 1):
+        self.rate = rate_per_minute / 60.0
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()  # Tokens are accounted up to this moment (in the future while paused)
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            if now > self._updated:
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+            self._tokens -= 1
+            # Negative tokens are slots already promised to earlier callers
+            wait = self._updated - now + max(0.0, -self._tokens) / self.rate
+        if wait > 0:
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """No tokens are handed out (or accumulated) for the next `seconds`."""
+        with self._lock:
+            until = time.monotonic() + seconds
+            if until > self._updated:
+                self._updated = until
+                self._tokens = min(self._tokens, 0.0)
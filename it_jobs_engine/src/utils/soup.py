@@ -0,0 +1,50 @@
+from typing import Dict, Tuple
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.element import Tag
+
+try:
+    import lxml  # noqa: F401  Optional: C tokenizer, several times faster than html.parser
+    FAST_PARSER = "lxml"
+except ImportError:
+    FAST_PARSER = "html.parser"
+
+def make_soup(html: str, parse_only: SoupStrainer = None, fast: bool = True) -> BeautifulSoup:
+    """
+    Fast mode parses with lxml when it's installed and only builds the
+    elements matched by parse_only (and everything inside them); the rest
+    of the page is tokenized but never turned into Tag objects. Otherwise
+    the whole page is parsed with html.parser.
+    """
+    if not fast:
+        return BeautifulSoup(html, "html.parser")
+    return BeautifulSoup(html, FAST_PARSER, parse_only=parse_only)
+
+def has_class(css_class: str):
+    """
+    SoupStrainer class_ matcher. A strainer sees the raw attribute ("a b c"),
+    not the split list, so class_="b" alone would never match it.
+    """
+    return lambda value: value is not None and css_class in value.split()
+
+def find_first(root: Tag, targets: Dict[str, Tuple[str, str]]) -> Dict[str, Tag]:
+    """
+    {key: first descendant matching (tag name, CSS class)} for every target,
+    in one walk over root. Same tags as calling root.find(name, class_=cls)
+    per target, without a full scan each; missing targets are left out.
+    """
+    by_name = {}
+    for key, (name, css_class) in targets.items():
+        by_name.setdefault(name, []).append((key, css_class))
+
+    found = {}
+    for element in root.descendants:
+        candidates = by_name.get(element.name)  # None for strings, their name is None
+        if not candidates:
+            continue
+        classes = element.get("class", ())
+        for key, css_class in candidates:
+            if key not in found and css_class in classes:
+                found[key] = element
+                if len(found) == len(targets):
+                    return found
+    return found
@@ -12,12 +12,9 @@ def test_fetch():
     
     print("Saving to DB...")
     db = DatabaseManager()
-    saved_count = 0
-    for job in jobs:
-        if db.save_job(job):
-            saved_count += 1
+    new_hashes = db.save_jobs(jobs)
             
-    print(f"Saved {saved_count} new jobs to DB.")
+    print(f"Saved {len(new_hashes)} new jobs to DB.")
 
 if __name__ == "__main__":
     test_fetch()